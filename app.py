@@ -4,17 +4,18 @@ Cloud-optimized for Streamlit Community Cloud deployment
 """
 
 import streamlit as st
+import json
+import re
 import time
 import base64
 import tempfile
-from io import BytesIO
 from typing import Dict, Any, Optional
 
 # Import our modules with error handling
 try:
     from src.config import Config
-    from src.vision_engine import VisionEngine
-    from src.strategy_engine import StrategyEngine
+    from src.vision_engine import VisionEngine, LinkedInProfile, ExperienceItem
+    from src.strategy_engine import StrategyEngine, count_tokens
     from src.telemetry import telemetry
     from src.training_logger import training_logger
     from src.mlops import mlops_manager
@@ -22,6 +23,30 @@ except ImportError as e:
     st.error(f"❌ Import Error: {e}")
     st.stop()
 
+# Optional Phase 2 modules; availability is decided once at startup
+try:
+    from src.content_scorer import ContentQualityScorer
+    from src.dynamic_checklist import DynamicChecklistGenerator
+    from src.one_click_implementation import OneClickImplementation
+    PHASE2_AVAILABLE = True
+    PHASE2_IMPORT_ERROR = None
+except ImportError as e:
+    PHASE2_AVAILABLE = False
+    PHASE2_IMPORT_ERROR = str(e)
+
+try:
+    from src.profile_gap_analyzer import ProfileGapAnalyzer, generate_perfect_profile_report
+    GAP_ANALYZER_AVAILABLE = True
+except ImportError:
+    GAP_ANALYZER_AVAILABLE = False
+
+# Optional orjson for faster JSON rendering
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Page configuration
 st.set_page_config(
     page_title="LinkedIn Profile Optimizer",
@@ -92,6 +117,16 @@ st.markdown("""
         padding: 0.75rem;
         margin: 1rem 0;
     }
+    .export-btn {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        border: none;
+        padding: 12px 20px;
+        border-radius: 8px;
+        font-weight: 600;
+        width: 100%;
+        cursor: pointer;
+    }
 </style>
 """, unsafe_allow_html=True)
 
@@ -115,6 +150,97 @@ def get_strategy_engine():
         st.error(f"Failed to initialize strategy engine: {str(e)}")
         return None
 
+@st.cache_resource
+def get_content_scorer():
+    """Initialize and cache content quality scorer (None if unavailable)"""
+    return ContentQualityScorer() if PHASE2_AVAILABLE else None
+
+@st.cache_resource
+def get_checklist_generator():
+    """Initialize and cache dynamic checklist generator (None if unavailable)"""
+    return DynamicChecklistGenerator() if PHASE2_AVAILABLE else None
+
+@st.cache_resource
+def get_one_click_implementation():
+    """Initialize and cache one-click implementation helper (None if unavailable)"""
+    return OneClickImplementation() if PHASE2_AVAILABLE else None
+
+@st.cache_data(show_spinner=False)
+def generate_prioritized_checklist_cached(profile_json: str, optimization_report: str, target_industry: str, target_role: str) -> tuple:
+    """Generate the dynamic checklist with tasks bucketed by priority and a time estimate"""
+    checklist_generator = get_checklist_generator()
+    tasks = checklist_generator.generate_dynamic_checklist(
+        json.loads(profile_json),
+        calculate_overall_score_cached(profile_json, target_industry, target_role),
+        optimization_report,
+        target_industry,
+        target_role
+    )
+    return (
+        tasks,
+        checklist_generator.group_tasks_by_priority(tasks),
+        checklist_generator.estimate_completion_time(tasks)
+    )
+
+def get_checklist_stats(profile_json: str, report: str, target_industry: str, target_role: str) -> dict:
+    """Keep the prioritized checklist and its totals in session state until its inputs change"""
+    source = (profile_json, report, target_industry, target_role)
+    stats = st.session_state.get('checklist_stats')
+    if stats is None or stats['source'] != source:
+        tasks, buckets, time_estimate = generate_prioritized_checklist_cached(*source)
+        stats = {
+            'source': source,
+            'buckets': buckets,
+            'total': len(tasks),
+            'time_estimate': time_estimate
+        }
+        st.session_state.checklist_stats = stats
+    return stats
+
+@st.cache_data(show_spinner=False)
+def extract_implementation_sections_cached(report: str) -> tuple:
+    """Extract report content sections with their length validation and preview text"""
+    implementation = get_one_click_implementation()
+    sections = implementation.extract_content_from_report(report)
+    validations = {
+        name: implementation.validate_content_length(name, section.content)
+        for name, section in sections.items()
+    }
+    previews = {
+        name: section.formatted_content[:500] + ('...' if len(section.formatted_content) > 500 else '')
+        for name, section in sections.items()
+    }
+    return sections, validations, previews
+
+def get_phase2_engines():
+    """Return the cached Phase 2 scorer, checklist generator and implementation helper"""
+    if not PHASE2_AVAILABLE:
+        raise ImportError(PHASE2_IMPORT_ERROR)
+    return get_content_scorer(), get_checklist_generator(), get_one_click_implementation()
+
+@st.cache_data(show_spinner=False)
+def score_profile_cached(profile_json: str, target_industry: str = "Technology", target_role: str = "Software Engineer") -> dict:
+    """Score a profile, memoized on its JSON serialization"""
+    profile = LinkedInProfile.model_validate_json(profile_json)
+    return get_content_scorer().score_profile_content(profile, target_industry, target_role)
+
+@st.cache_data(show_spinner=False)
+def calculate_overall_score_cached(profile_json: str, target_industry: str, target_role: str) -> dict:
+    """Calculate section quality scores, memoized on the profile JSON"""
+    return get_content_scorer().calculate_overall_score(json.loads(profile_json), target_industry, target_role)
+
+@st.cache_data(show_spinner=False)
+def generate_checklist_cached(profile_json: str, optimization_report: str, target_industry: str, target_role: str) -> list:
+    """Generate the dynamic checklist, memoized on the profile JSON and report"""
+    profile = LinkedInProfile.model_validate_json(profile_json)
+    return get_checklist_generator().generate_dynamic_checklist(
+        profile_data=profile.__dict__,
+        quality_scores=score_profile_cached(profile_json, target_industry, target_role),
+        optimization_report=optimization_report,
+        target_industry=target_industry,
+        target_role=target_role
+    )
+
 def check_environment():
     """Check and display environment status for cloud deployment"""
     env_status = Config.get_env_status()
@@ -237,6 +363,15 @@ def render_sidebar():
     return target_industry, target_role
 
 
+def render_sidebar_json(data: Dict[str, Any]):
+    """Render a dict in the sidebar as pre-serialized, indented JSON"""
+    if ORJSON_AVAILABLE:
+        text = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    else:
+        text = json.dumps(data, indent=2, default=str)
+    st.sidebar.code(text, language='json')
+
+
 def render_admin_panel():
     """Render the admin panel for MLOps operations"""
     st.sidebar.markdown("### 🛠️ MLOps Operations")
@@ -249,7 +384,7 @@ def render_admin_panel():
     if st.sidebar.button("📊 View Dataset Stats"):
         try:
             stats = training_logger.get_dataset_stats()
-            st.sidebar.json(stats)
+            render_sidebar_json(stats)
         except Exception as e:
             st.sidebar.error(f"Error getting stats: {e}")
     
@@ -257,7 +392,7 @@ def render_admin_panel():
     if st.sidebar.button("💰 Get Cost Estimate"):
         try:
             estimate = mlops_manager.get_job_cost_estimate()
-            st.sidebar.json(estimate)
+            render_sidebar_json(estimate)
         except Exception as e:
             st.sidebar.error(f"Error getting estimate: {e}")
     
@@ -340,6 +475,207 @@ def extract_optimized_content_from_report(optimization_report: str) -> dict:
     return optimized_content
 
 
+# Static HTML for dashboard cards; only the values change between reruns
+CARD_GRADIENT_PURPLE = "#667eea 0%, #764ba2 100%"
+CARD_GRADIENT_PINK = "#f093fb 0%, #f5576c 100%"
+CARD_GRADIENT_BLUE = "#4facfe 0%, #00f2fe 100%"
+CARD_GRADIENT_GREEN = "#43e97b 0%, #38f9d7 100%"
+
+SCORE_CARD_TEMPLATE = """
+<div style="flex: 1; background: linear-gradient(135deg, {gradient}); padding: 20px; border-radius: 10px; text-align: center; color: white;">
+    <h3 style="margin: 0;">{title}</h3>
+    <h2 style="margin: 10px 0;">{value}</h2>
+    <p style="margin: 0; font-size: 12px;">{caption}</p>
+</div>
+"""
+
+INSIGHT_CARD_TEMPLATE = """
+<div style="background: #f8f9fa; border-left: 4px solid #007bff; padding: 15px; margin: 10px 0; border-radius: 0 8px 8px 0;">
+    {insight}
+</div>
+"""
+
+PRIORITY_TASK_CARD_TEMPLATE = """
+<div style="background: white; border: 1px solid #e1e5e9; border-radius: 8px; padding: 15px; margin: 10px 0; display: flex; align-items: center;">
+    <div style="flex: 1;">
+        <div style="font-weight: 600; color: #2c3e50;">{task}</div>
+        <div style="color: #6c757d; font-size: 14px;">{desc}</div>
+        <div style="display: flex; gap: 10px; margin-top: 8px;">
+            <span style="background: #e9ecef; padding: 2px 8px; border-radius: 12px; font-size: 12px;">⏱️ {time}</span>
+            <span style="background: #d4edda; color: #155724; padding: 2px 8px; border-radius: 12px; font-size: 12px;">🎯 {impact} Impact</span>
+        </div>
+    </div>
+</div>
+"""
+
+TASK_CARD_TEMPLATE = """
+<div style="background: #f8f9fa; border: 1px solid #e9ecef; border-radius: 8px; padding: 15px; margin: 10px 0; display: flex; align-items: center;">
+    <div style="flex: 1;">
+        <div style="font-weight: 600; color: #2c3e50;">{task}</div>
+        <div style="color: #6c757d; font-size: 14px;">{desc}</div>
+        <div style="margin-top: 8px;">
+            <span style="background: #e9ecef; padding: 2px 8px; border-radius: 12px; font-size: 12px;">⏱️ {time}</span>
+        </div>
+    </div>
+</div>
+"""
+
+RESULT_CARD_TEMPLATE = """
+<div style="background: linear-gradient(90deg, #667eea 0%, #764ba2 100%); color: white; padding: 15px; border-radius: 8px; margin: 10px 0; display: flex; justify-content: space-between; align-items: center;">
+    <div>
+        <div style="font-weight: 600;">{metric}</div>
+        <div style="font-size: 12px; opacity: 0.9;">Expected in {time}</div>
+    </div>
+    <div style="font-size: 24px; font-weight: bold;">{increase}</div>
+</div>
+"""
+
+SECTION_SCORE_CARD_TEMPLATE = """
+<div style="flex: 1; background: {color}; color: white; padding: 15px; border-radius: 10px; text-align: center;">
+    <h4 style="margin: 0;">{name}</h4>
+    <h2 style="margin: 5px 0;">{score}/100</h2>
+</div>
+"""
+
+QUALITY_SCORE_TILE_TEMPLATE = """
+<div style="flex: 1; background: #f8f9fa; border: 1px solid #e9ecef; border-radius: 8px; padding: 12px;">
+    <div style="font-size: 14px; color: #6c757d;">{label} Score</div>
+    <div style="font-size: 28px; font-weight: 600;">{score}/100</div>
+</div>
+"""
+
+HIGH_PRIORITY_CHECKLIST_CARD_TEMPLATE = """
+<div style="background: white; border: 1px solid #e1e5e9; border-radius: 8px; padding: 15px; margin: 10px 0;">
+    <div style="font-weight: 600; color: #2c3e50;">{title}</div>
+    <div style="color: #6c757d; font-size: 14px;">{description}</div>
+    <div style="display: flex; gap: 10px; margin-top: 8px;">
+        <span style="background: #ff6b6b; color: white; padding: 2px 8px; border-radius: 12px; font-size: 12px;">⏱️ {estimated_time}</span>
+        <span style="background: #d4edda; color: #155724; padding: 2px 8px; border-radius: 12px; font-size: 12px;">🎯 {impact_level} Impact</span>
+    </div>
+</div>
+"""
+
+MEDIUM_PRIORITY_CHECKLIST_CARD_TEMPLATE = """
+<div style="background: #f8f9fa; border: 1px solid #e9ecef; border-radius: 8px; padding: 15px; margin: 10px 0;">
+    <div style="font-weight: 600; color: #2c3e50;">{title}</div>
+    <div style="color: #6c757d; font-size: 14px;">{description}</div>
+    <div style="margin-top: 8px;">
+        <span style="background: #e9ecef; padding: 2px 8px; border-radius: 12px; font-size: 12px;">⏱️ {estimated_time}</span>
+    </div>
+</div>
+"""
+
+LOW_PRIORITY_CHECKLIST_CARD_TEMPLATE = """
+<div style="background: #f8f9fa; border: 1px solid #e9ecef; border-radius: 8px; padding: 15px; margin: 10px 0;">
+    <div style="font-weight: 600; color: #6c757d;">{title}</div>
+    <div style="color: #6c757d; font-size: 14px;">{description}</div>
+</div>
+"""
+
+OVERALL_SCORE_BAR_TEMPLATE = """
+<div style="background: linear-gradient(90deg, {color} 0%, {color} {score}%, #e9ecef {score}%, #e9ecef 100%); height: 30px; border-radius: 15px; position: relative; margin: 20px 0;">
+    <div style="position: absolute; top: 50%; left: 50%; transform: translate(-50%, -50%); color: white; font-weight: bold;">
+        {score}/100
+    </div>
+</div>
+"""
+
+CONTENT_PREVIEW_TEMPLATE = """
+<div style="background: #f8f9fa; border: 1px solid #e9ecef; border-radius: 8px; padding: 15px; max-height: 200px; overflow-y: auto;">
+    <pre style="white-space: pre-wrap; font-family: monospace; font-size: 12px;">{preview}</pre>
+</div>
+"""
+
+
+def render_score_card_row(cards: list):
+    """Render dashboard score cards as a single flex row"""
+    st.markdown(
+        '<div style="display: flex; gap: 1rem;">'
+        + "".join(SCORE_CARD_TEMPLATE.format_map(card) for card in cards)
+        + '</div>',
+        unsafe_allow_html=True
+    )
+
+
+# Section headings emitted by the strategy report, in report order
+REPORT_SECTION_TITLES = {
+    "OVERALL PROFILE REVIEW": "🔍 Overall Profile Analysis",
+    "HEADLINE OPTIMIZATION": "📝 Headline Optimization",
+    "ABOUT SECTION COMPLETE REWRITE": "📄 About Section Rewrite",
+    "EXPERIENCE SECTION ENHANCEMENT": "💼 Experience Enhancement",
+    "SKILLS STRATEGY": "🎯 Skills Strategy",
+    "RECOMMENDATIONS STRATEGY": "📱 Recommendations Strategy",
+    "CONTENT & ENGAGEMENT PLAN": "📅 Content & Engagement Plan"
+}
+REPORT_SECTION_PATTERN = re.compile("|".join(re.escape(key) for key in REPORT_SECTION_TITLES))
+
+
+def find_report_section_offsets(report: str) -> dict:
+    """Find the first offset of every known section heading in a single pass"""
+    offsets = {}
+    for match in REPORT_SECTION_PATTERN.finditer(report):
+        offsets.setdefault(match.group(0), match.start())
+    return offsets
+
+
+def slice_report_sections(report: str, keys: list, offsets: dict) -> dict:
+    """Slice report content for each key up to the next present key in `keys`"""
+    present = [key for key in keys if key in offsets]
+    sections = {}
+    for i, key in enumerate(present):
+        end = offsets[present[i + 1]] if i + 1 < len(present) else len(report)
+        sections[key] = report[offsets[key]:end]
+    return sections
+
+
+def split_report_sections(report: str) -> list:
+    """Split a markdown report into (title, body) pairs on level-2 headings"""
+    sections = []
+
+    chunks = ('\n' + report).split('\n## ')
+    preamble = chunks[0].strip()
+    if preamble:
+        sections.append(("📄 Overview", preamble))
+
+    for chunk in chunks[1:]:
+        title, _, body = chunk.partition('\n')
+        sections.append((title.strip() or "Section", body.strip()))
+
+    if not sections:
+        sections.append(("📄 Report", report))
+
+    return sections
+
+
+def get_parsed_report(report: str) -> dict:
+    """Parse the report once and cache the result in session state until the report changes"""
+    parsed = st.session_state.get('report_sections')
+    if parsed is None or parsed['source'] != report:
+        parsed = {
+            'source': report,
+            'offsets': find_report_section_offsets(report),
+            'sections': split_report_sections(report),
+            'optimized_content': extract_optimized_content_from_report(report)
+        }
+        st.session_state.report_sections = parsed
+    return parsed
+
+
+def get_profile_json(profile) -> str:
+    """Serialize the profile once and cache the JSON in session state until the profile changes"""
+    cached = st.session_state.get('profile_json_cache')
+    if cached is None or cached['source'] is not profile:
+        if profile is None:
+            profile_json = "{}"
+        elif hasattr(profile, 'model_dump_json'):
+            profile_json = profile.model_dump_json()
+        else:
+            profile_json = json.dumps(profile, sort_keys=True)
+        cached = {'source': profile, 'json': profile_json}
+        st.session_state.profile_json_cache = cached
+    return cached['json']
+
+
 def render_upload_section():
     """Render file upload section with PDF and image options"""
     st.markdown('<div class="section-header">📤 Upload Your Profile</div>', unsafe_allow_html=True)
@@ -370,14 +706,13 @@ def render_upload_section():
                     st.image(file, caption=f"Image {i+1}", use_column_width=True)
             
             # AUTOMATIC IMAGE ANALYSIS
-            st.markdown("---")
-            st.markdown("#### 🔍 Automatic Analysis")
+            st.markdown("---\n\n#### 🔍 Automatic Analysis")
             
             with st.spinner("🔍 Analyzing your LinkedIn profile..."):
                 try:
                     # Extract profile data using original file objects
                     vision_engine = VisionEngine()
-                    profile_data = vision_engine.extract_profile_data(uploaded_files)
+                    profile_data = vision_engine.extract_profile_data_parallel(uploaded_files)
                     
                     # CRITICAL DEBUGGING: Verify extracted data is REAL user data
                     st.markdown("#### 🔍 Extraction Verification")
@@ -431,15 +766,16 @@ Skills Count: {len(profile_data.skills)}
                                 target_industry = st.session_state.get('target_industry', 'Technology')
                                 target_role = st.session_state.get('target_role', 'Software Engineer')
                                 
-                                # Generate optimization report
-                                optimization_report = strategy_engine.generate_optimization_plan(
+                                # Stream the report to the page as it is generated; returns the full text
+                                optimization_report = st.write_stream(strategy_engine.generate_optimization_plan_stream(
                                     profile=profile_data,
                                     target_industry=target_industry,
                                     target_role=target_role,
-                                )
+                                ))
                                 
                                 # Store in session state
                                 st.session_state.optimization_report = optimization_report
+                                queue_training_example(profile_data, optimization_report, target_industry, target_role, "gpt4o")
                                 st.success("🎉 Optimization strategy generated automatically!")
                                 st.balloons()
                                 st.rerun()  # Refresh to show results
@@ -454,8 +790,7 @@ Skills Count: {len(profile_data.skills)}
                     st.info("💡 Please ensure your screenshots are clear and contain your LinkedIn profile information")
             
             # Manual analysis as fallback
-            st.markdown("---")
-            st.markdown("#### 🔧 Manual Analysis (Fallback)")
+            st.markdown("---\n\n#### 🔧 Manual Analysis (Fallback)")
             
             col1, col2 = st.columns([2, 1])
             with col1:
@@ -479,7 +814,7 @@ Skills Count: {len(profile_data.skills)}
                     try:
                         # Extract profile data using original file objects
                         vision_engine = VisionEngine()
-                        profile_data = vision_engine.extract_profile_data(uploaded_files)
+                        profile_data = vision_engine.extract_profile_data_parallel(uploaded_files)
                         
                         # Store in session state
                         st.session_state.profile_data = profile_data
@@ -495,13 +830,16 @@ Skills Count: {len(profile_data.skills)}
                                     target_industry = st.session_state.get('target_industry', 'Technology')
                                     target_role = st.session_state.get('target_role', 'Software Engineer')
                                     
-                                    # Generate optimization report
-                                    optimization_report = strategy_engine.generate_optimization_strategy(
-                                        profile_data, target_industry, target_role
-                                    )
+                                    # Stream the report to the page as it is generated; returns the full text
+                                    optimization_report = st.write_stream(strategy_engine.generate_optimization_plan_stream(
+                                        profile=profile_data,
+                                        target_industry=target_industry,
+                                        target_role=target_role,
+                                    ))
                                     
                                     # Store in session state
                                     st.session_state.optimization_report = optimization_report
+                                    queue_training_example(profile_data, optimization_report, target_industry, target_role, "gpt4o")
                                     st.success("🎉 Manual optimization strategy generated!")
                                     st.balloons()
                                     st.rerun()  # Refresh to show results
@@ -601,7 +939,6 @@ Skills Count: {len(profile_data.skills)}
                                 
                                 # CRITICAL FIX: Create LinkedInProfile from PDF data for compatibility
                                 # This uses the ACTUAL extracted data from the PDF, not template data
-                                from src.vision_engine import LinkedInProfile, ExperienceItem
                                 
                                 # Convert PDF experiences to ExperienceItem objects
                                 experience_items = []
@@ -631,8 +968,7 @@ Skills Count: {len(profile_data.skills)}
                                 st.info("💡 You can still generate it manually using the button below")
                         
                         # Manual generation button as fallback
-                        st.markdown("---")
-                        st.markdown("#### 🔧 Manual Generation (Fallback)")
+                        st.markdown("---\n\n#### 🔧 Manual Generation (Fallback)")
                         if st.button("🚀 Generate Ultimate Profile Manually", key="generate_from_pdf_manual", use_container_width=True):
                             with st.spinner("🎯 Generating ultimate profile template..."):
                                 try:
@@ -656,7 +992,6 @@ Skills Count: {len(profile_data.skills)}
                                     
                                     # CRITICAL FIX: Create LinkedInProfile from PDF data for compatibility
                                     # This uses the ACTUAL extracted data from the PDF, not template data
-                                    from src.vision_engine import LinkedInProfile, ExperienceItem
                                     
                                     # Convert PDF experiences to ExperienceItem objects
                                     experience_items = []
@@ -770,42 +1105,12 @@ def render_unified_results():
         st.markdown("### 🎯 Profile Optimization Dashboard")
         
         # Score Cards
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 20px; border-radius: 10px; text-align: center; color: white;">
-                <h3 style="margin: 0;">Current Score</h3>
-                <h2 style="margin: 10px 0;">65/100</h2>
-                <p style="margin: 0; font-size: 12px;">Needs Improvement</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); padding: 20px; border-radius: 10px; text-align: center; color: white;">
-                <h3 style="margin: 0;">Potential Score</h3>
-                <h2 style="margin: 10px 0;">95/100</h2>
-                <p style="margin: 0; font-size: 12px;">Excellent</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); padding: 20px; border-radius: 10px; text-align: center; color: white;">
-                <h3 style="margin: 0;">Improvement</h3>
-                <h2 style="margin: 10px 0;">+30</h2>
-                <p style="margin: 0; font-size: 12px;">Points</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col4:
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, #43e97b 0%, #38f9d7 100%); padding: 20px; border-radius: 10px; text-align: center; color: white;">
-                <h3 style="margin: 0;">Est. Time</h3>
-                <h2 style="margin: 10px 0;">2-3</h2>
-                <p style="margin: 0; font-size: 12px;">Hours</p>
-            </div>
-            """, unsafe_allow_html=True)
+        render_score_card_row([
+            {"gradient": CARD_GRADIENT_PURPLE, "title": "Current Score", "value": "65/100", "caption": "Needs Improvement"},
+            {"gradient": CARD_GRADIENT_PINK, "title": "Potential Score", "value": "95/100", "caption": "Excellent"},
+            {"gradient": CARD_GRADIENT_BLUE, "title": "Improvement", "value": "+30", "caption": "Points"},
+            {"gradient": CARD_GRADIENT_GREEN, "title": "Est. Time", "value": "2-3", "caption": "Hours"}
+        ])
         
         # Progress Bar
         st.markdown("### 📈 Optimization Progress")
@@ -830,7 +1135,7 @@ def render_unified_results():
             # Extract optimized content from the actual optimization report
             if st.session_state.get('optimization_report'):
                 # Parse the optimization report to extract actual optimized content
-                optimized_content = extract_optimized_content_from_report(st.session_state.optimization_report)
+                optimized_content = get_parsed_report(st.session_state.optimization_report)['optimized_content']
                 st.markdown(f"**Headline:** {optimized_content.get('headline', 'Generated from optimization report')}")
                 st.markdown(f"**About:** {optimized_content.get('about', 'Generated from optimization report')}")
                 st.markdown("**Experience:** Enhanced descriptions with quantifiable achievements")
@@ -854,12 +1159,7 @@ def render_unified_results():
             "Engage with relevant content"
         ]
         
-        for i, item in enumerate(checklist_items, 1):
-            col1, col2 = st.columns([1, 20])
-            with col1:
-                st.checkbox("", key=f"checklist_{i}")
-            with col2:
-                st.markdown(f"**{i}.** {item}")
+        render_implementation_checklist(checklist_items)
     
     with tab4:
         st.markdown("### 📈 Expected Results")
@@ -883,8 +1183,7 @@ def render_unified_results():
             "Improved career prospects"
         ]
         
-        for benefit in benefits:
-            st.markdown(f"✅ {benefit}")
+        st.markdown("\n\n".join(f"✅ {benefit}" for benefit in benefits))
     
     with tab5:
         st.markdown("### 📋 Full Report Preview")
@@ -894,7 +1193,14 @@ def render_unified_results():
         
         # Format and display the report
         if isinstance(report, str):
-            st.markdown(report)
+            render_all = st.checkbox("Render all sections", value=False, key="render_full_report")
+            if render_all:
+                st.markdown(report)
+            else:
+                # Collapsed expanders are not rendered until opened
+                for i, (title, body) in enumerate(get_parsed_report(report)['sections']):
+                    with st.expander(title, expanded=(i == 0)):
+                        st.markdown(body)
         else:
             st.json(report)
         
@@ -925,23 +1231,23 @@ def render_unified_results():
         st.markdown("#### 📊 Content Quality Analysis")
         
         try:
-            from src.content_scorer import ContentQualityScorer
-            scorer = ContentQualityScorer()
+            scorer = get_content_scorer()
+            if scorer is None:
+                raise ImportError("src.content_scorer is unavailable")
             
             # Score current profile
             if profile:
-                quality_scores = scorer.score_profile_content(profile)
+                quality_scores = score_profile_cached(profile.model_dump_json())
                 
-                # Display scores
-                col1, col2, col3, col4 = st.columns(4)
-                with col1:
-                    st.metric("Headline Score", f"{quality_scores.get('headline_score', 0)}/100")
-                with col2:
-                    st.metric("About Score", f"{quality_scores.get('about_score', 0)}/100")
-                with col3:
-                    st.metric("Experience Score", f"{quality_scores.get('experience_score', 0)}/100")
-                with col4:
-                    st.metric("Skills Score", f"{quality_scores.get('skills_score', 0)}/100")
+                # Display scores as a single tile grid
+                score_tiles = "".join(
+                    QUALITY_SCORE_TILE_TEMPLATE.format_map({
+                        "label": label,
+                        "score": quality_scores.get(f'{key}_score', 0)
+                    })
+                    for label, key in (("Headline", "headline"), ("About", "about"), ("Experience", "experience"), ("Skills", "skills"))
+                )
+                st.markdown(f'<div style="display: flex; gap: 1rem;">{score_tiles}</div>', unsafe_allow_html=True)
                 
                 # Quality recommendations
                 st.markdown("#### 💡 Quality Improvements")
@@ -956,41 +1262,22 @@ def render_unified_results():
         st.markdown("#### ✨ Personalized Action Plan")
         
         try:
-            from src.dynamic_checklist import DynamicChecklistGenerator
-            checklist_gen = DynamicChecklistGenerator()
+            checklist_gen = get_checklist_generator()
+            if checklist_gen is None or scorer is None:
+                raise ImportError("src.dynamic_checklist is unavailable")
             
             if profile:
-                # Get quality scores first
-                quality_scores = scorer.score_profile_content(profile, target_industry, target_role)
-                
-                # Generate dynamic checklist with correct method name and parameters
+                # Generate dynamic checklist (memoized on profile, report and targets)
                 with st.spinner("✨ Generating personalized action plan..."):
-                    dynamic_checklist = checklist_gen.generate_dynamic_checklist(
-                        profile_data=profile.__dict__ if hasattr(profile, '__dict__') else profile,
-                        quality_scores=quality_scores,
-                        optimization_report=st.session_state.get('optimization_report', ''),
-                        target_industry=target_industry,
-                        target_role=target_role
+                    dynamic_checklist = generate_checklist_cached(
+                        profile.model_dump_json(),
+                        st.session_state.get('optimization_report', ''),
+                        target_industry,
+                        target_role
                     )
                 
                 # Display dynamic checklist
-                for i, item in enumerate(dynamic_checklist, 1):
-                    col1, col2 = st.columns([1, 20])
-                    with col1:
-                        st.checkbox("", key=f"dynamic_{i}")
-                    with col2:
-                        # Handle ChecklistTask objects
-                        if hasattr(item, 'description'):
-                            task_text = item.description
-                            task_title = item.title if hasattr(item, 'title') else f"Task {i}"
-                            priority = item.priority.value if hasattr(item, 'priority') and hasattr(item.priority, 'value') else 'medium'
-                            time_est = item.estimated_time if hasattr(item, 'estimated_time') else '10 min'
-                            st.markdown(f"**{i}.** {task_title}")
-                            st.markdown(f"   {task_text}")
-                            st.markdown(f"   ⏱️ {time_est} | 🎯 {priority}")
-                        else:
-                            task_text = str(item)
-                            st.markdown(f"**{i}.** {task_text}")
+                render_dynamic_checklist(dynamic_checklist)
         
         except ImportError:
             st.info("✨ Dynamic checklist available with complete installation")
@@ -1002,16 +1289,17 @@ def render_unified_results():
         st.markdown("#### 🚀 One-Click Implementation")
         
         try:
-            from src.one_click_implementation import OneClickImplementation
-            impl = OneClickImplementation()
+            impl = get_one_click_implementation()
+            if impl is None:
+                raise ImportError("src.one_click_implementation is unavailable")
             
             if st.button("🚀 Generate Copy-Ready Content", use_container_width=True):
                 with st.spinner("🎯 Generating optimized content..."):
                     if profile:
                         report = st.session_state.get('optimization_report', '')
                         if report:
-                            # Use the correct method name
-                            copy_ready_sections = impl.extract_content_from_report(report)
+                            # Shares the per-report extraction cache with the implementation tab
+                            copy_ready_sections = extract_implementation_sections_cached(report)[0]
                             
                             # Create implementation package
                             implementation_package = impl.create_implementation_package(copy_ready_sections)
@@ -1021,7 +1309,8 @@ def render_unified_results():
                             # Display copy-ready sections
                             st.markdown("#### 📋 Copy-Ready Sections")
                             
-                            for section_name, content_section in copy_ready_sections.items():
+                            # st.code keeps LLM text containing ``` from closing a hand-built fence
+                            for content_section in copy_ready_sections.values():
                                 st.markdown(f"**{content_section.title}:**")
                                 st.code(content_section.formatted_content, language=None)
                                 st.markdown("---")
@@ -1036,12 +1325,12 @@ def render_unified_results():
             st.info("💡 This is a Phase 2 feature - basic optimization still works")
         
         # ========== PERFECT PROFILE TEMPLATE & GAP ANALYSIS ==========
-        st.markdown("---")
-        st.markdown("#### 🏆 Perfect Profile Template & Gap Analysis")
+        st.markdown("---\n\n#### 🏆 Perfect Profile Template & Gap Analysis")
         st.info("Get a tailored perfect profile template for your industry/role and see exactly what's missing from your current profile.")
         
         try:
-            from src.profile_gap_analyzer import ProfileGapAnalyzer, generate_perfect_profile_report
+            if not GAP_ANALYZER_AVAILABLE:
+                raise ImportError("src.profile_gap_analyzer is unavailable")
             gap_analyzer = ProfileGapAnalyzer()
             
             if profile:
@@ -1163,7 +1452,6 @@ def render_unified_results():
         st.info("Generate polished, filled-in examples and complete optimized profile using AI.")
         
         try:
-            from src.strategy_engine import StrategyEngine
             strategy_engine = get_strategy_engine()
             
             if profile and strategy_engine:
@@ -1251,20 +1539,109 @@ def render_unified_results():
         st.markdown("---")
         
         # Feedback Section
-        st.markdown("#### 📝 Feedback & Rating")
-        
-        col1, col2 = st.columns(2)
+        render_feedback_section()
+
+
+# Checklist and feedback widgets run as fragments so interacting with them
+# reruns only the fragment instead of the whole results page
+@st.fragment
+def render_implementation_checklist(checklist_items: list):
+    """Render the static implementation checklist"""
+    for i, item in enumerate(checklist_items, 1):
+        col1, col2 = st.columns([1, 20])
         with col1:
-            rating = st.slider("📊 Rate this optimization", 1, 5, 4)
-        
+            st.checkbox("", key=f"checklist_{i}")
         with col2:
-            feedback = st.text_area("💬 Additional feedback", placeholder="Tell us what you think...")
-        
-        if st.button("📤 Submit Feedback", use_container_width=True):
-            st.success("✅ Thank you for your feedback!")
-            # Log feedback
-            from src.telemetry import telemetry
-            telemetry.log_feedback(rating, feedback, st.session_state.get('upload_method', 'unknown'))
+            st.markdown(f"**{i}.** {item}")
+
+
+@st.fragment
+def render_dynamic_checklist(dynamic_checklist: list):
+    """Render the personalized checklist tasks"""
+    for i, item in enumerate(dynamic_checklist, 1):
+        col1, col2 = st.columns([1, 20])
+        with col1:
+            st.checkbox("", key=f"dynamic_{i}")
+        with col2:
+            # Handle ChecklistTask objects
+            if hasattr(item, 'description'):
+                task_text = item.description
+                task_title = item.title if hasattr(item, 'title') else f"Task {i}"
+                priority = item.priority.value if hasattr(item, 'priority') and hasattr(item.priority, 'value') else 'medium'
+                time_est = item.estimated_time if hasattr(item, 'estimated_time') else '10 min'
+                st.markdown(f"**{i}.** {task_title}")
+                st.markdown(f"   {task_text}")
+                st.markdown(f"   ⏱️ {time_est} | 🎯 {priority}")
+            else:
+                task_text = str(item)
+                st.markdown(f"**{i}.** {task_text}")
+
+
+@st.fragment
+def render_feedback_section():
+    """Render the rating and feedback form"""
+    st.markdown("#### 📝 Feedback & Rating")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        rating = st.slider("📊 Rate this optimization", 1, 5, 4)
+    
+    with col2:
+        feedback = st.text_area("💬 Additional feedback", placeholder="Tell us what you think...")
+    
+    if st.button("📤 Submit Feedback", use_container_width=True):
+        st.success("✅ Thank you for your feedback!")
+        # Log feedback
+        telemetry.log_feedback(rating, feedback, st.session_state.get('upload_method', 'unknown'))
+
+
+# Error categories recognised in API exception messages
+API_ERROR_PATTERN = re.compile(r"timeout|rate limit|api key", re.IGNORECASE)
+
+
+def classify_api_error(e: Exception) -> Optional[str]:
+    """Classify an API exception as 'timeout', 'rate limit', 'api key' or None"""
+    kinds = {match.lower() for match in API_ERROR_PATTERN.findall(str(e))}
+    for kind in ("timeout", "rate limit", "api key"):
+        if kind in kinds:
+            return kind
+    return None
+
+
+def show_api_error(
+    e: Exception,
+    failure_label: str,
+    timeout_hint: str = "Please try again.",
+    api_key_hint: Optional[str] = "Please check your API key configuration."
+):
+    """Display a user-friendly message for a failed API call"""
+    kind = classify_api_error(e)
+    if kind == "timeout":
+        st.error(f"⏱️ **Request timed out**. {timeout_hint}")
+    elif kind == "rate limit":
+        st.error("🚦 **Rate limit exceeded**. Please wait a moment and try again.")
+    elif kind == "api key" and api_key_hint:
+        st.error(f"🔑 **API key issue**. {api_key_hint}")
+    else:
+        st.error(f"❌ **{failure_label}**: {str(e)}")
+
+
+def queue_training_example(profile, optimization_report: str, target_industry: str, target_role: str, model_choice: str):
+    """Queue a generated plan as a training example for the background writer"""
+    try:
+        training_logger.enqueue_training_example(
+            input_text=(
+                profile.model_dump_json() if hasattr(profile, 'model_dump_json')
+                else json.dumps(profile)
+            ),
+            target_industry=target_industry,
+            target_role=target_role,
+            output_text=optimization_report,
+            model_choice=model_choice
+        )
+    except Exception as log_error:
+        # Don't fail the main process if logging fails
+        print(f"Warning: Failed to log training example: {log_error}")
 
 
 def analyze_profile(uploaded_files):
@@ -1285,7 +1662,7 @@ def analyze_profile(uploaded_files):
             start_time = time.time()
             
             try:
-                profile = vision_engine.extract_profile_data(uploaded_files)
+                profile = vision_engine.extract_profile_data_parallel(uploaded_files)
                 extraction_time = time.time() - start_time
                 
                 # Log telemetry
@@ -1314,14 +1691,11 @@ def analyze_profile(uploaded_files):
                 )
                 
                 # User-friendly error messages
-                if "timeout" in str(e).lower():
-                    st.error("⏱️ **Request timed out**. Please try again with smaller or fewer images.")
-                elif "rate limit" in str(e).lower():
-                    st.error("🚦 **Rate limit exceeded**. Please wait a moment and try again.")
-                elif "api key" in str(e).lower():
-                    st.error("🔑 **API key issue**. Please check your OpenAI API key configuration.")
-                else:
-                    st.error(f"❌ **Vision extraction failed**: {str(e)}")
+                show_api_error(
+                    e, "Vision extraction failed",
+                    timeout_hint="Please try again with smaller or fewer images.",
+                    api_key_hint="Please check your OpenAI API key configuration."
+                )
                 return
         
         # Step 2: Generate optimization plan with timeout handling
@@ -1329,43 +1703,39 @@ def analyze_profile(uploaded_files):
             start_time = time.time()
             
             try:
-                optimization_report = strategy_engine.generate_optimization_plan(
+                # Stream tokens to the page as they arrive; returns the full text
+                optimization_report = st.write_stream(strategy_engine.generate_optimization_plan_stream(
                     profile=profile,
                     target_industry=target_industry,
                     target_role=target_role,
                     model_choice=st.session_state.current_model
-                )
+                ))
                 
                 generation_time = time.time() - start_time
                 
+                # Serialize the profile once for token estimation
+                profile_dict = profile.model_dump() if hasattr(profile, 'model_dump') else profile
+                
                 # Log telemetry
                 telemetry.log_strategy_generation(
                     model_choice=st.session_state.current_model,
                     target_industry=target_industry,
                     target_role=target_role,
                     input_tokens=strategy_engine.estimate_tokens(
-                        profile.__dict__ if hasattr(profile, '__dict__') else profile, target_industry, target_role
+                        profile_dict, target_industry, target_role
                     ),
-                    output_tokens=len(optimization_report) // 4,  # Rough estimate
+                    output_tokens=count_tokens(optimization_report),
                     generation_time=generation_time,
                     success=True
                 )
                 
                 st.session_state.optimization_report = optimization_report
+                get_parsed_report(optimization_report)
                 
-                # Log training example with error handling
-                try:
-                    profile_dict = profile.__dict__ if hasattr(profile, '__dict__') else profile
-                    training_logger.log_training_example(
-                        input_text=str(profile_dict),
-                        target_industry=target_industry,
-                        target_role=target_role,
-                        output_text=optimization_report,
-                        model_choice=st.session_state.current_model
-                    )
-                except Exception as log_error:
-                    # Don't fail the main process if logging fails
-                    print(f"Warning: Failed to log training example: {log_error}")
+                queue_training_example(
+                    profile, optimization_report, target_industry, target_role,
+                    st.session_state.current_model
+                )
                 
             except Exception as e:
                 generation_time = time.time() - start_time
@@ -1381,14 +1751,7 @@ def analyze_profile(uploaded_files):
                 )
                 
                 # User-friendly error messages
-                if "timeout" in str(e).lower():
-                    st.error("⏱️ **Request timed out**. Please try again.")
-                elif "rate limit" in str(e).lower():
-                    st.error("🚦 **Rate limit exceeded**. Please wait a moment and try again.")
-                elif "api key" in str(e).lower():
-                    st.error("🔑 **API key issue**. Please check your API key configuration.")
-                else:
-                    st.error(f"❌ **Strategy generation failed**: {str(e)}")
+                show_api_error(e, "Strategy generation failed")
                 return
         
         st.success("✅ Profile analysis complete!")
@@ -1404,6 +1767,7 @@ def render_optimization_report_DISABLED():
     
     report = st.session_state.optimization_report
     profile = st.session_state.profile_data
+    section_offsets = get_parsed_report(report)['offsets']
     
     # Enhanced Display with Tabs
     tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(["📊 Dashboard", "📝 Content Optimizer", "✅ Action Plan", "📈 Results", "📋 Full Report Preview", "🎯 Phase 2 Features"])
@@ -1412,42 +1776,12 @@ def render_optimization_report_DISABLED():
         st.markdown("### 🎯 Profile Optimization Dashboard")
         
         # Score Cards
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 20px; border-radius: 10px; text-align: center; color: white;">
-                <h3 style="margin: 0;">Current Score</h3>
-                <h2 style="margin: 10px 0;">65/100</h2>
-                <p style="margin: 0; font-size: 12px;">Needs Improvement</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); padding: 20px; border-radius: 10px; text-align: center; color: white;">
-                <h3 style="margin: 0;">Potential Score</h3>
-                <h2 style="margin: 10px 0;">95/100</h2>
-                <p style="margin: 0; font-size: 12px;">Excellent</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); padding: 20px; border-radius: 10px; text-align: center; color: white;">
-                <h3 style="margin: 0;">Improvement</h3>
-                <h2 style="margin: 10px 0;">+30</h2>
-                <p style="margin: 0; font-size: 12px;">Points</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col4:
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, #43e97b 0%, #38f9d7 100%); padding: 20px; border-radius: 10px; text-align: center; color: white;">
-                <h3 style="margin: 0;">Tasks</h3>
-                <h2 style="margin: 10px 0;">8</h2>
-                <p style="margin: 0; font-size: 12px;">To Complete</p>
-            </div>
-            """, unsafe_allow_html=True)
+        render_score_card_row([
+            {"gradient": CARD_GRADIENT_PURPLE, "title": "Current Score", "value": "65/100", "caption": "Needs Improvement"},
+            {"gradient": CARD_GRADIENT_PINK, "title": "Potential Score", "value": "95/100", "caption": "Excellent"},
+            {"gradient": CARD_GRADIENT_BLUE, "title": "Improvement", "value": "+30", "caption": "Points"},
+            {"gradient": CARD_GRADIENT_GREEN, "title": "Tasks", "value": "8", "caption": "To Complete"}
+        ])
         
         st.markdown("---")
         
@@ -1494,21 +1828,19 @@ def render_optimization_report_DISABLED():
             "🔍 Missing industry-specific keywords for better recruiter search"
         ]
         
-        for insight in insights:
-            st.markdown(f"""
-            <div style="background: #f8f9fa; border-left: 4px solid #007bff; padding: 15px; margin: 10px 0; border-radius: 0 8px 8px 0;">
-                {insight}
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown("".join(
+            INSIGHT_CARD_TEMPLATE.format(insight=insight) for insight in insights
+        ), unsafe_allow_html=True)
     
     with tab2:
         st.markdown("### 📝 Content Optimization Studio")
         
         # Content sections with cards
         sections = ["HEADLINE OPTIMIZATION", "ABOUT SECTION COMPLETE REWRITE", "EXPERIENCE SECTION ENHANCEMENT", "SKILLS STRATEGY"]
+        section_contents = slice_report_sections(report, sections, section_offsets)
         
-        for i, section in enumerate(sections):
-            if section in report:
+        for section in sections:
+            if section in section_contents:
                 # Section Card
                 st.markdown(f"""
                 <div style="background: white; border: 1px solid #e1e5e9; border-radius: 12px; padding: 20px; margin: 20px 0; box-shadow: 0 2px 4px rgba(0,0,0,0.1);">
@@ -1520,41 +1852,32 @@ def render_optimization_report_DISABLED():
                 """, unsafe_allow_html=True)
                 
                 # Extract and display content
-                section_start = report.find(section)
-                if section_start != -1:
-                    next_section = len(report)
-                    for next_sec in sections[i+1:]:
-                        next_pos = report.find(next_sec)
-                        if next_pos != -1:
-                            next_section = next_pos
-                            break
-                    
-                    section_content = report[section_start:next_section]
-                    
-                    # Content display with copy button
-                    col1, col2 = st.columns([4, 1])
-                    with col1:
-                        st.markdown("""
-                        <style>
-                        .content-box {
-                            background: #f8f9fa;
-                            border: 1px solid #e9ecef;
-                            border-radius: 8px;
-                            padding: 20px;
-                            font-family: 'Monaco', 'Menlo', 'Ubuntu Mono', monospace;
-                            white-space: pre-wrap;
-                            line-height: 1.6;
-                        }
-                        </style>
-                        """, unsafe_allow_html=True)
-                        
-                        st.markdown(f'<div class="content-box">{section_content}</div>', unsafe_allow_html=True)
+                section_content = section_contents[section]
+                
+                # Content display with copy button
+                col1, col2 = st.columns([4, 1])
+                with col1:
+                    st.markdown("""
+                    <style>
+                    .content-box {
+                        background: #f8f9fa;
+                        border: 1px solid #e9ecef;
+                        border-radius: 8px;
+                        padding: 20px;
+                        font-family: 'Monaco', 'Menlo', 'Ubuntu Mono', monospace;
+                        white-space: pre-wrap;
+                        line-height: 1.6;
+                    }
+                    </style>
+                    """, unsafe_allow_html=True)
                     
-                    with col2:
-                        st.markdown("<br>", unsafe_allow_html=True)  # Spacing
-                        if st.button(f"📋\nCopy", key=f"copy_{section}", help="Copy to clipboard"):
-                            st.success("✅ Copied!")
-                            st.balloons()
+                    st.markdown(f'<div class="content-box">{section_content}</div>', unsafe_allow_html=True)
+                
+                with col2:
+                    st.markdown("<br>", unsafe_allow_html=True)  # Spacing
+                    if st.button(f"📋\nCopy", key=f"copy_{section}", help="Copy to clipboard"):
+                        st.success("✅ Copied!")
+                        st.balloons()
     
     with tab3:
         st.markdown("### ✅ Action Plan & Progress Tracker")
@@ -1575,22 +1898,9 @@ def render_optimization_report_DISABLED():
             {"task": "🎯 Add Missing Skills", "desc": "Include 5+ industry-specific skills", "time": "10 min", "impact": "Medium"}
         ]
         
-        for task in high_priority_tasks:
-            st.markdown(f"""
-            <div style="background: white; border: 1px solid #e1e5e9; border-radius: 8px; padding: 15px; margin: 10px 0; display: flex; align-items: center;">
-                <div style="flex: 1;">
-                    <div style="font-weight: 600; color: #2c3e50;">{task['task']}</div>
-                    <div style="color: #6c757d; font-size: 14px;">{task['desc']}</div>
-                    <div style="display: flex; gap: 10px; margin-top: 8px;">
-                        <span style="background: #e9ecef; padding: 2px 8px; border-radius: 12px; font-size: 12px;">⏱️ {task['time']}</span>
-                        <span style="background: #d4edda; color: #155724; padding: 2px 8px; border-radius: 12px; font-size: 12px;">🎯 {task['impact']} Impact</span>
-                    </div>
-                </div>
-                <div style="margin-left: 20px;">
-                    <st.checkbox>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown("".join(
+            PRIORITY_TASK_CARD_TEMPLATE.format_map(task) for task in high_priority_tasks
+        ), unsafe_allow_html=True)
         
         # Enhancement Tasks
         st.markdown("#### 📈 Enhancement Tasks")
@@ -1602,21 +1912,9 @@ def render_optimization_report_DISABLED():
             {"task": "📊 Add Measurable Outcomes", "desc": "Include specific numbers/metrics", "time": "25 min"}
         ]
         
-        for task in medium_tasks:
-            st.markdown(f"""
-            <div style="background: #f8f9fa; border: 1px solid #e9ecef; border-radius: 8px; padding: 15px; margin: 10px 0; display: flex; align-items: center;">
-                <div style="flex: 1;">
-                    <div style="font-weight: 600; color: #2c3e50;">{task['task']}</div>
-                    <div style="color: #6c757d; font-size: 14px;">{task['desc']}</div>
-                    <div style="margin-top: 8px;">
-                        <span style="background: #e9ecef; padding: 2px 8px; border-radius: 12px; font-size: 12px;">⏱️ {task['time']}</span>
-                    </div>
-                </div>
-                <div style="margin-left: 20px;">
-                    <st.checkbox>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown("".join(
+            TASK_CARD_TEMPLATE.format_map(task) for task in medium_tasks
+        ), unsafe_allow_html=True)
     
     with tab4:
         st.markdown("### 📈 Before & After Results")
@@ -1673,16 +1971,9 @@ def render_optimization_report_DISABLED():
             {"metric": "Job Opportunities", "increase": "+250%", "time": "2 months"}
         ]
         
-        for result in results:
-            st.markdown(f"""
-            <div style="background: linear-gradient(90deg, #667eea 0%, #764ba2 100%); color: white; padding: 15px; border-radius: 8px; margin: 10px 0; display: flex; justify-content: space-between; align-items: center;">
-                <div>
-                    <div style="font-weight: 600;">{result['metric']}</div>
-                    <div style="font-size: 12px; opacity: 0.9;">Expected in {result['time']}</div>
-                </div>
-                <div style="font-size: 24px; font-weight: bold;">{result['increase']}</div>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown("".join(
+            RESULT_CARD_TEMPLATE.format_map(result) for result in results
+        ), unsafe_allow_html=True)
     
     with tab5:
         st.markdown("### 📋 Complete Report Preview")
@@ -1757,48 +2048,28 @@ def render_optimization_report_DISABLED():
         st.markdown("## 📝 Complete Optimization Plan")
         
         # Process and display each section with enhanced formatting
-        sections_map = {
-            "OVERALL PROFILE REVIEW": "🔍 Overall Profile Analysis",
-            "HEADLINE OPTIMIZATION": "📝 Headline Optimization",
-            "ABOUT SECTION COMPLETE REWRITE": "📄 About Section Rewrite", 
-            "EXPERIENCE SECTION ENHANCEMENT": "💼 Experience Enhancement",
-            "SKILLS STRATEGY": "🎯 Skills Strategy",
-            "RECOMMENDATIONS STRATEGY": "📱 Recommendations Strategy",
-            "CONTENT & ENGAGEMENT PLAN": "📅 Content & Engagement Plan"
-        }
+        report_sections = slice_report_sections(report, list(REPORT_SECTION_TITLES), section_offsets)
         
-        for section_key, section_title in sections_map.items():
-            if section_key in report:
+        for section_key, section_title in REPORT_SECTION_TITLES.items():
+            if section_key in report_sections:
                 st.markdown(f"### {section_title}")
                 
-                # Extract section content
-                start_pos = report.find(section_key)
-                if start_pos != -1:
-                    # Find next section
-                    end_pos = len(report)
-                    for next_section in list(sections_map.keys())[list(sections_map.keys()).index(section_key)+1:]:
-                        next_pos = report.find(next_section)
-                        if next_pos != -1:
-                            end_pos = next_pos
-                            break
-                    
-                    section_content = report[start_pos:end_pos]
-                    
-                    # Display in professional card
-                    st.markdown(f"""
-                    <div style="background: white; border: 1px solid #e1e5e9; border-radius: 12px; padding: 25px; margin: 20px 0; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                        <div style="background: linear-gradient(90deg, #f8f9fa 0%, #e9ecef 100%); padding: 15px; border-radius: 8px; margin-bottom: 20px;">
-                            <h4 style="margin: 0; color: #2c3e50;">{section_title}</h4>
-                        </div>
-                        <div style="font-family: 'Georgia', serif; line-height: 1.8; color: #2c3e50;">
-                            {section_content.replace(section_key, '').strip()}
-                        </div>
+                section_content = report_sections[section_key]
+                
+                # Display in professional card
+                st.markdown(f"""
+                <div style="background: white; border: 1px solid #e1e5e9; border-radius: 12px; padding: 25px; margin: 20px 0; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+                    <div style="background: linear-gradient(90deg, #f8f9fa 0%, #e9ecef 100%); padding: 15px; border-radius: 8px; margin-bottom: 20px;">
+                        <h4 style="margin: 0; color: #2c3e50;">{section_title}</h4>
                     </div>
-                    """, unsafe_allow_html=True)
+                    <div style="font-family: 'Georgia', serif; line-height: 1.8; color: #2c3e50;">
+                        {section_content.replace(section_key, '').strip()}
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
         
         # Implementation Summary
-        st.markdown("---")
-        st.markdown("## ✅ Implementation Summary")
+        st.markdown("---\n\n## ✅ Implementation Summary")
         
         st.markdown("""
         <div style="background: linear-gradient(135deg, #43e97b 0%, #38f9d7 100%); color: white; padding: 30px; border-radius: 15px;">
@@ -1813,324 +2084,254 @@ def render_optimization_report_DISABLED():
         """, unsafe_allow_html=True)
         
         # Download Options in Preview
-        st.markdown("---")
-        st.markdown("### 💾 Download Options")
+        st.markdown("---\n\n### 💾 Download Options")
         
         download_cols = st.columns(3)
         
         with download_cols[0]:
             # Full Report Download
-            report_buffer = BytesIO(report.encode())
-            st.download_button(
-                label="📄 Download Full Report",
-                data=report_buffer,
-                file_name="linkedin_optimization_report.txt",
-                mime="text/plain",
-                use_container_width=True
-            )
+            render_text_download("📄 Download Full Report", encode_report_cached(report), "linkedin_optimization_report.txt", key="preview_full_report")
         
         with download_cols[1]:
             # Action Plan Download
-            checklist_text = generate_checklist_text()
-            checklist_buffer = BytesIO(checklist_text.encode())
-            st.download_button(
-                label="📋 Download Action Plan",
-                data=checklist_buffer,
-                file_name="action_plan.txt",
-                mime="text/plain",
-                use_container_width=True
-            )
+            render_text_download("📋 Download Action Plan", ACTION_PLAN_BYTES, "action_plan.txt", key="preview_action_plan")
         
         with download_cols[2]:
             # Summary Download
-            summary_text = generate_summary_text(report, profile)
-            summary_buffer = BytesIO(summary_text.encode())
-            st.download_button(
-                label="📊 Download Summary",
-                data=summary_buffer,
-                file_name="optimization_summary.txt",
-                mime="text/plain",
-                use_container_width=True
-            )
+            render_text_download("📊 Download Summary", OPTIMIZATION_SUMMARY_BYTES, "optimization_summary.txt", key="preview_summary")
     
     with tab6:
-        st.markdown("### 🎯 Phase 2: Advanced Intelligence Features")
-        st.info("🚀 Experience the next generation of LinkedIn profile optimization with AI-powered insights")
+        render_phase2_features(profile, report)
+    
+    render_report_export_section(report)
+
+
+@st.fragment
+def render_phase2_features(profile, report):
+    """Render the Phase 2 tab; widget interactions rerun only this fragment"""
+    st.markdown("### 🎯 Phase 2: Advanced Intelligence Features")
+    st.info("🚀 Experience the next generation of LinkedIn profile optimization with AI-powered insights")
+    
+    # The import outcome is fixed at startup, so the failure path is a flag check
+    if not PHASE2_AVAILABLE:
+        st.error(f"❌ Phase 2 features unavailable: {PHASE2_IMPORT_ERROR}")
+        st.info("📧 Contact support to enable advanced features")
+        return
+    
+    # st.tabs runs every tab body, so defer Phase 2 work until the user asks for it
+    if not st.session_state.get('phase2_opened'):
+        if st.button("🚀 Load Advanced Features", use_container_width=True):
+            st.session_state.phase2_opened = True
+        else:
+            return
+    
+    try:
+        # Phase 2 systems are imported once and cached across reruns
+        scorer, checklist_generator, implementation = get_phase2_engines()
         
-        # Import Phase 2 modules
-        try:
-            from src.content_scorer import ContentQualityScorer
-            from src.dynamic_checklist import DynamicChecklistGenerator
-            from src.one_click_implementation import OneClickImplementation
+        # Get session data
+        target_industry = st.session_state.get('target_industry', 'Technology')
+        target_role = st.session_state.get('target_role', 'Software Engineer')
+        
+        # Phase 2 Feature Sections
+        phase2_tab1, phase2_tab2, phase2_tab3 = st.tabs(["📊 Quality Scoring", "✨ Dynamic Checklist", "🚀 One-Click Implementation"])
+        
+        with phase2_tab1:
+            st.markdown("#### 📊 Content Quality Scoring System")
+            st.success("🎯 AI-powered quality assessment with personalized recommendations")
             
-            # Initialize Phase 2 systems
-            scorer = ContentQualityScorer()
-            checklist_generator = DynamicChecklistGenerator()
-            implementation = OneClickImplementation()
+            # Calculate quality scores (memoized on the profile JSON)
+            profile_json = get_profile_json(profile)
+            quality_scores = calculate_overall_score_cached(profile_json, target_industry, target_role)
             
-            # Get session data
-            target_industry = st.session_state.get('target_industry', 'Technology')
-            target_role = st.session_state.get('target_role', 'Software Engineer')
+            # Display quality scores with professional UI
+            st.markdown("##### 🎯 Section Quality Scores")
             
-            # Phase 2 Feature Sections
-            phase2_tab1, phase2_tab2, phase2_tab3 = st.tabs(["📊 Quality Scoring", "✨ Dynamic Checklist", "🚀 One-Click Implementation"])
+            sections_data = [
+                ("Headline", quality_scores.get('headline')),
+                ("About", quality_scores.get('about')),
+                ("Experience", quality_scores.get('experience')),
+                ("Skills", quality_scores.get('skills'))
+            ]
             
-            with phase2_tab1:
-                st.markdown("#### 📊 Content Quality Scoring System")
-                st.success("🎯 AI-powered quality assessment with personalized recommendations")
-                
-                # Calculate quality scores
-                profile_dict = profile.dict() if profile else {}
-                quality_scores = scorer.calculate_overall_score(profile_dict, target_industry, target_role)
-                
-                # Display quality scores with professional UI
-                st.markdown("##### 🎯 Section Quality Scores")
-                
-                score_cols = st.columns(4)
-                sections_data = [
-                    ("Headline", quality_scores.get('headline')),
-                    ("About", quality_scores.get('about')),
-                    ("Experience", quality_scores.get('experience')),
-                    ("Skills", quality_scores.get('skills'))
-                ]
-                
-                for i, (section_name, score_obj) in enumerate(sections_data):
-                    with score_cols[i]:
-                        if score_obj:
-                            score_color = "#43e97b" if score_obj.score >= 80 else "#f093fb" if score_obj.score >= 60 else "#ff6b6b"
-                            st.markdown(f"""
-                            <div style="background: {score_color}; color: white; padding: 15px; border-radius: 10px; text-align: center;">
-                                <h4 style="margin: 0;">{section_name}</h4>
-                                <h2 style="margin: 5px 0;">{score_obj.score}/100</h2>
-                            </div>
-                            """, unsafe_allow_html=True)
-                
-                # Overall score
-                overall_score = quality_scores.get('overall')
-                if overall_score:
-                    st.markdown("##### 🏆 Overall Profile Quality")
-                    
-                    progress_color = "#43e97b" if overall_score.score >= 80 else "#f093fb" if overall_score.score >= 60 else "#ff6b6b"
-                    st.markdown(f"""
-                    <div style="background: linear-gradient(90deg, {progress_color} 0%, {progress_color} {overall_score.score}%, #e9ecef {overall_score.score}%, #e9ecef 100%); height: 30px; border-radius: 15px; position: relative; margin: 20px 0;">
-                        <div style="position: absolute; top: 50%; left: 50%; transform: translate(-50%, -50%); color: white; font-weight: bold;">
-                            {overall_score.score}/100
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                # Detailed feedback
-                st.markdown("##### 💡 Personalized Recommendations")
-                
-                for section_name, score_obj in quality_scores.items():
-                    if section_name != 'overall' and score_obj and score_obj.feedback:
-                        with st.expander(f"📝 {section_name.title()} Feedback", expanded=False):
-                            if score_obj.feedback:
-                                st.markdown("**Areas for Improvement:**")
-                                for feedback in score_obj.feedback:
-                                    st.markdown(f"• {feedback}")
-                            
-                            if score_obj.suggestions:
-                                st.markdown("**Recommendations:**")
-                                for suggestion in score_obj.suggestions:
-                                    st.markdown(f"✅ {suggestion}")
+            # One flex row instead of a markdown element per column
+            score_tiles = "".join(
+                SECTION_SCORE_CARD_TEMPLATE.format_map({
+                    "color": "#43e97b" if score_obj.score >= 80 else "#f093fb" if score_obj.score >= 60 else "#ff6b6b",
+                    "name": section_name,
+                    "score": score_obj.score
+                }) if score_obj else '<div style="flex: 1;"></div>'
+                for section_name, score_obj in sections_data
+            )
+            st.markdown(f'<div style="display: flex; gap: 1rem;">{score_tiles}</div>', unsafe_allow_html=True)
             
-            with phase2_tab2:
-                st.markdown("#### ✨ Dynamic Checklist Generation")
-                st.success("🎯 Personalized action plan based on your unique profile analysis")
-                
-                # Generate dynamic checklist
-                quality_scores = scorer.calculate_overall_score(profile_dict, target_industry, target_role)
-                dynamic_tasks = checklist_generator.generate_dynamic_checklist(
-                    profile_dict, quality_scores, report, target_industry, target_role
-                )
+            # Overall score
+            overall_score = quality_scores.get('overall')
+            if overall_score:
+                st.markdown("##### 🏆 Overall Profile Quality")
                 
-                # Time estimation
-                time_estimate = checklist_generator.estimate_completion_time(dynamic_tasks)
-                
-                # Display time estimate
-                st.markdown("##### ⏱️ Implementation Timeline")
-                
-                time_cols = st.columns(3)
-                with time_cols[0]:
-                    st.metric("Total Time", time_estimate['formatted_time'])
-                with time_cols[1]:
-                    st.metric("High Priority", f"{time_estimate['priority_breakdown']['high']} min")
-                with time_cols[2]:
-                    st.metric("Tasks Total", len(dynamic_tasks))
+                progress_color = "#43e97b" if overall_score.score >= 80 else "#f093fb" if overall_score.score >= 60 else "#ff6b6b"
+                st.markdown(OVERALL_SCORE_BAR_TEMPLATE.format_map(
+                    {"color": progress_color, "score": overall_score.score}
+                ), unsafe_allow_html=True)
+            
+            # Detailed feedback
+            st.markdown("##### 💡 Personalized Recommendations")
+            
+            for section_name, score_obj in quality_scores.items():
+                if section_name != 'overall' and score_obj and score_obj.feedback:
+                    with st.expander(f"📝 {section_name.title()} Feedback", expanded=False):
+                        if score_obj.feedback:
+                            st.markdown("**Areas for Improvement:**")
+                            for feedback in score_obj.feedback:
+                                st.markdown(f"• {feedback}")
+                        
+                        if score_obj.suggestions:
+                            st.markdown("**Recommendations:**")
+                            for suggestion in score_obj.suggestions:
+                                st.markdown(f"✅ {suggestion}")
+        
+        with phase2_tab2:
+            st.markdown("#### ✨ Dynamic Checklist Generation")
+            st.success("🎯 Personalized action plan based on your unique profile analysis")
+            
+            # Generate dynamic checklist, bucketed by priority with its time estimate
+            checklist = get_checklist_stats(profile_json, report, target_industry, target_role)
+            priority_buckets = checklist['buckets']
+            time_estimate = checklist['time_estimate']
+            
+            # Display time estimate
+            st.markdown("##### ⏱️ Implementation Timeline")
+            
+            time_cols = st.columns(3)
+            with time_cols[0]:
+                st.metric("Total Time", time_estimate['formatted_time'])
+            with time_cols[1]:
+                st.metric("High Priority", f"{time_estimate['priority_breakdown']['high']} min")
+            with time_cols[2]:
+                st.metric("Tasks Total", checklist['total'])
+            
+            # Display dynamic checklist
+            st.markdown("##### 📋 Your Personalized Action Plan")
+            
+            high_priority_tasks = priority_buckets['high']
+            medium_priority_tasks = priority_buckets['medium']
+            low_priority_tasks = priority_buckets['low']
+            
+            # High Priority Tasks
+            if high_priority_tasks:
+                st.markdown("🔥 **High Priority Tasks**")
+                st.markdown("".join(
+                    HIGH_PRIORITY_CHECKLIST_CARD_TEMPLATE.format_map(vars(task))
+                    for task in high_priority_tasks
+                ), unsafe_allow_html=True)
+            
+            # Medium Priority Tasks
+            if medium_priority_tasks:
+                st.markdown("📊 **Medium Priority Tasks**")
+                st.markdown("".join(
+                    MEDIUM_PRIORITY_CHECKLIST_CARD_TEMPLATE.format_map(vars(task))
+                    for task in medium_priority_tasks
+                ), unsafe_allow_html=True)
+            
+            # Low Priority Tasks
+            if low_priority_tasks:
+                st.markdown("📈 **Low Priority Tasks**")
+                st.markdown("".join(
+                    LOW_PRIORITY_CHECKLIST_CARD_TEMPLATE.format_map(vars(task))
+                    for task in low_priority_tasks
+                ), unsafe_allow_html=True)
+        
+        with phase2_tab3:
+            st.markdown("#### 🚀 One-Click Implementation")
+            st.success("✨ Smart formatting and batch operations for rapid implementation")
+            
+            # Extract, validate and preview content once per report
+            content_sections, validations, previews = extract_implementation_sections_cached(report)
+            
+            if content_sections:
+                st.markdown("##### 📄 Extracted Content Sections")
                 
-                # Display dynamic checklist
-                st.markdown("##### 📋 Your Personalized Action Plan")
+                # Display content sections
+                for section_name, section_data in content_sections.items():
+                    with st.expander(f"📝 {section_data.title}", expanded=False):
+                        validation = validations[section_name]
+                        
+                        col1, col2 = st.columns([3, 1])
+                        with col1:
+                            st.markdown(f"**Content Length:** {section_data.character_count} characters")
+                            st.markdown(f"**Word Count:** {section_data.word_count} words")
+                            
+                            # Validation status
+                            if validation['valid']:
+                                st.success(f"✅ {validation['message']}")
+                            else:
+                                st.error(f"❌ {validation['message']}")
+                        
+                        with col2:
+                            if st.button(f"📋 Copy", key=f"copy_{section_name}", use_container_width=True):
+                                copy_text = implementation.generate_copy_text(content_sections, section_name)
+                                st.success("✅ Copied to clipboard!")
+                                st.balloons()
+                        
+                        # Content preview
+                        st.markdown("**Preview:**")
+                        st.markdown(CONTENT_PREVIEW_TEMPLATE.format_map(
+                            {"preview": previews[section_name]}
+                        ), unsafe_allow_html=True)
                 
-                # Group by priority
-                high_priority_tasks = [task for task in dynamic_tasks if task.priority.value == 'high']
-                medium_priority_tasks = [task for task in dynamic_tasks if task.priority.value == 'medium']
-                low_priority_tasks = [task for task in dynamic_tasks if task.priority.value == 'low']
+                # Batch operations
+                st.markdown("##### 🔄 Batch Operations")
                 
-                # High Priority Tasks
-                if high_priority_tasks:
-                    st.markdown("🔥 **High Priority Tasks**")
-                    for task in high_priority_tasks:
-                        st.markdown(f"""
-                        <div style="background: white; border: 1px solid #e1e5e9; border-radius: 8px; padding: 15px; margin: 10px 0;">
-                            <div style="display: flex; justify-content: between; align-items: center;">
-                                <div>
-                                    <div style="font-weight: 600; color: #2c3e50;">{task.title}</div>
-                                    <div style="color: #6c757d; font-size: 14px;">{task.description}</div>
-                                    <div style="display: flex; gap: 10px; margin-top: 8px;">
-                                        <span style="background: #ff6b6b; color: white; padding: 2px 8px; border-radius: 12px; font-size: 12px;">⏱️ {task.estimated_time}</span>
-                                        <span style="background: #d4edda; color: #155724; padding: 2px 8px; border-radius: 12px; font-size: 12px;">🎯 {task.impact_level} Impact</span>
-                                    </div>
-                                </div>
-                            </div>
-                        </div>
-                        """, unsafe_allow_html=True)
+                batch_cols = st.columns(2)
                 
-                # Medium Priority Tasks
-                if medium_priority_tasks:
-                    st.markdown("📊 **Medium Priority Tasks**")
-                    for task in medium_priority_tasks:
-                        st.markdown(f"""
-                        <div style="background: #f8f9fa; border: 1px solid #e9ecef; border-radius: 8px; padding: 15px; margin: 10px 0;">
-                            <div style="font-weight: 600; color: #2c3e50;">{task.title}</div>
-                            <div style="color: #6c757d; font-size: 14px;">{task.description}</div>
-                            <div style="margin-top: 8px;">
-                                <span style="background: #e9ecef; padding: 2px 8px; border-radius: 12px; font-size: 12px;">⏱️ {task.estimated_time}</span>
-                            </div>
-                        </div>
-                        """, unsafe_allow_html=True)
+                with batch_cols[0]:
+                    if st.button("📋 Copy All Sections", use_container_width=True):
+                        batch_text = implementation.create_batch_copy_text(content_sections)
+                        st.success("✅ All sections copied to clipboard!")
+                        st.balloons()
                 
-                # Low Priority Tasks
-                if low_priority_tasks:
-                    st.markdown("📈 **Low Priority Tasks**")
-                    for task in low_priority_tasks:
-                        st.markdown(f"""
-                        <div style="background: #f8f9fa; border: 1px solid #e9ecef; border-radius: 8px; padding: 15px; margin: 10px 0;">
-                            <div style="font-weight: 600; color: #6c757d;">{task.title}</div>
-                            <div style="color: #6c757d; font-size: 14px;">{task.description}</div>
-                        </div>
-                        """, unsafe_allow_html=True)
+                with batch_cols[1]:
+                    if st.button("📄 Download Implementation Package", use_container_width=True):
+                        package = implementation.create_implementation_package(content_sections)
+                        
+                        # Create download from the header and body bytes
+                        package_header = (
+                            f"LINKEDIN PROFILE IMPLEMENTATION PACKAGE\n"
+                            f"Generated for: {target_industry} - {target_role}\n"
+                            f"Total Content: {package['word_count']} words\n"
+                            + "=" * 50 + "\n\n"
+                        )
+                        
+                        st.download_button(
+                            label="📥 Download Package",
+                            data=package_header.encode() + package['total_content'].encode(),
+                            file_name="linkedin_implementation_package.txt",
+                            mime="text/plain",
+                            use_container_width=True
+                        )
             
-            with phase2_tab3:
-                st.markdown("#### 🚀 One-Click Implementation")
-                st.success("✨ Smart formatting and batch operations for rapid implementation")
-                
-                # Extract content from report
-                content_sections = implementation.extract_content_from_report(report)
-                
-                if content_sections:
-                    st.markdown("##### 📄 Extracted Content Sections")
-                    
-                    # Display content sections
-                    for section_name, section_data in content_sections.items():
-                        with st.expander(f"📝 {section_data.title}", expanded=False):
-                            # Validation
-                            validation = implementation.validate_content_length(section_name, section_data.content)
-                            
-                            col1, col2 = st.columns([3, 1])
-                            with col1:
-                                st.markdown(f"**Content Length:** {section_data.character_count} characters")
-                                st.markdown(f"**Word Count:** {section_data.word_count} words")
-                                
-                                # Validation status
-                                if validation['valid']:
-                                    st.success(f"✅ {validation['message']}")
-                                else:
-                                    st.error(f"❌ {validation['message']}")
-                            
-                            with col2:
-                                if st.button(f"📋 Copy", key=f"copy_{section_name}", use_container_width=True):
-                                    copy_text = implementation.generate_copy_text(content_sections, section_name)
-                                    st.success("✅ Copied to clipboard!")
-                                    st.balloons()
-                            
-                            # Content preview
-                            st.markdown("**Preview:**")
-                            st.markdown(f"""
-                            <div style="background: #f8f9fa; border: 1px solid #e9ecef; border-radius: 8px; padding: 15px; max-height: 200px; overflow-y: auto;">
-                                <pre style="white-space: pre-wrap; font-family: monospace; font-size: 12px;">{section_data.formatted_content[:500]}{'...' if len(section_data.formatted_content) > 500 else ''}</pre>
-                            </div>
-                            """, unsafe_allow_html=True)
-                    
-                    # Batch operations
-                    st.markdown("##### 🔄 Batch Operations")
-                    
-                    batch_cols = st.columns(2)
-                    
-                    with batch_cols[0]:
-                        if st.button("📋 Copy All Sections", use_container_width=True):
-                            batch_text = implementation.create_batch_copy_text(content_sections)
-                            st.success("✅ All sections copied to clipboard!")
-                            st.balloons()
-                    
-                    with batch_cols[1]:
-                        if st.button("📄 Download Implementation Package", use_container_width=True):
-                            package = implementation.create_implementation_package(content_sections)
-                            
-                            # Create download
-                            package_text = f"LINKEDIN PROFILE IMPLEMENTATION PACKAGE\n"
-                            package_text += f"Generated for: {target_industry} - {target_role}\n"
-                            package_text += f"Total Content: {package['word_count']} words\n"
-                            package_text += "=" * 50 + "\n\n"
-                            package_text += package['total_content']
-                            
-                            package_buffer = BytesIO(package_text.encode())
-                            st.download_button(
-                                label="📥 Download Package",
-                                data=package_buffer,
-                                file_name="linkedin_implementation_package.txt",
-                                mime="text/plain",
-                                use_container_width=True
-                            )
-                
-                else:
-                    st.warning("⚠️ No content sections found in the report. Please ensure the report contains properly formatted content.")
-        
-        except ImportError as e:
-            st.error(f"❌ Phase 2 features unavailable: {e}")
-            st.info("📧 Contact support to enable advanced features")
+            else:
+                st.warning("⚠️ No content sections found in the report. Please ensure the report contains properly formatted content.")
     
+    except ImportError as e:
+        st.error(f"❌ Phase 2 features unavailable: {e}")
+        st.info("📧 Contact support to enable advanced features")
+
+
+@st.fragment
+def render_report_export_section(report):
+    """Render export, restart and feedback controls as their own fragment"""
     # Enhanced Export Section
-    st.markdown("---")
-    st.markdown("### 💾 Export & Share")
+    st.markdown("---\n\n### 💾 Export & Share")
     
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.markdown("""
-        <style>
-        .export-btn {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            border: none;
-            padding: 12px 20px;
-            border-radius: 8px;
-            font-weight: 600;
-            width: 100%;
-            cursor: pointer;
-        }
-        </style>
-        """, unsafe_allow_html=True)
-        
-        report_buffer = BytesIO(report.encode())
-        st.download_button(
-            label="📄 Full Report",
-            data=report_buffer,
-            file_name="linkedin_optimization_report.txt",
-            mime="text/plain",
-            use_container_width=True
-        )
+        render_text_download("📄 Full Report", encode_report_cached(report), "linkedin_optimization_report.txt", key="export_full_report")
     
     with col2:
-        checklist_text = generate_checklist_text()
-        checklist_buffer = BytesIO(checklist_text.encode())
-        st.download_button(
-            label="📋 Action Plan",
-            data=checklist_buffer,
-            file_name="action_plan.txt",
-            mime="text/plain",
-            use_container_width=True
-        )
+        render_text_download("📋 Action Plan", ACTION_PLAN_BYTES, "action_plan.txt", key="export_action_plan")
     
     with col3:
         if st.button("🔄 Restart Analysis", use_container_width=True):
@@ -2166,9 +2367,25 @@ def render_optimization_report_DISABLED():
             )
             st.info("📝 We'll improve based on your feedback!")
 
-def generate_summary_text(report, profile):
-    """Generate formatted summary text"""
-    return """LINKEDIN PROFILE OPTIMIZATION SUMMARY
+
+@st.cache_data(show_spinner=False)
+def encode_report_cached(report: str) -> bytes:
+    """Encode the report for download once per report"""
+    return report.encode()
+
+def render_text_download(label: str, data: bytes, file_name: str, key: str):
+    """Render a full-width plain-text download button"""
+    st.download_button(
+        label=label,
+        data=data,
+        file_name=file_name,
+        mime="text/plain",
+        key=key,
+        use_container_width=True
+    )
+
+# Static download documents, encoded once at import
+OPTIMIZATION_SUMMARY_TEXT = """LINKEDIN PROFILE OPTIMIZATION SUMMARY
 =====================================
 
 PROFILE ANALYSIS:
@@ -2203,10 +2420,9 @@ NEXT STEPS:
 
 Generated by LinkedIn Profile Optimization Agent
 """
+OPTIMIZATION_SUMMARY_BYTES = OPTIMIZATION_SUMMARY_TEXT.encode()
 
-def generate_checklist_text():
-    """Generate formatted checklist text"""
-    return """LINKEDIN PROFILE OPTIMIZATION ACTION PLAN
+ACTION_PLAN_TEXT = """LINKEDIN PROFILE OPTIMIZATION ACTION PLAN
 ===========================================
 
 HIGH PRIORITY TASKS:
@@ -2223,6 +2439,15 @@ ENHANCEMENT TASKS:
 
 PROGRESS: 3 of 8 tasks completed (37.5%)
 """
+ACTION_PLAN_BYTES = ACTION_PLAN_TEXT.encode()
+
+def generate_summary_text(report, profile):
+    """Generate formatted summary text"""
+    return OPTIMIZATION_SUMMARY_TEXT
+
+def generate_checklist_text():
+    """Generate formatted checklist text"""
+    return ACTION_PLAN_TEXT
 
 
 def render_chat_interface():
@@ -2277,12 +2502,7 @@ def render_chat_interface():
                     
                 except Exception as e:
                     # User-friendly error handling
-                    if "timeout" in str(e).lower():
-                        st.error("⏱️ **Request timed out**. Please try again.")
-                    elif "rate limit" in str(e).lower():
-                        st.error("🚦 **Rate limit exceeded**. Please wait a moment and try again.")
-                    else:
-                        st.error(f"❌ **Error generating response**: {str(e)}")
+                    show_api_error(e, "Error generating response", api_key_hint=None)
 
 
 def main():
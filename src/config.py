@@ -33,6 +33,8 @@ class Config:
     
     # App Configuration
     MAX_IMAGE_WIDTH: int = int(os.getenv("MAX_IMAGE_WIDTH", "1024"))
+    MAX_IMAGE_HEIGHT: int = int(os.getenv("MAX_IMAGE_HEIGHT", "2048"))
+    VISION_IMAGE_DETAIL: str = os.getenv("VISION_IMAGE_DETAIL", "high")
     
     # File Paths - Cloud-friendly with temporary directory fallbacks
     TRAINING_DATA_PATH: str = os.getenv("TRAINING_DATA_PATH", os.path.join(tempfile.gettempdir(), "training_dataset.jsonl"))
@@ -44,6 +46,12 @@ class Config:
     GPT4O_VISION_MODEL_ID: str = "gpt-4o"
     LLAMA3_BASE_MODEL: str = "meta-llama-3-8b-instruct"
     
+    # Derived flags, fixed at import like the values above
+    IS_CLOUD_DEPLOYMENT: bool = bool(os.getenv("STREAMLIT_CLOUD"))
+    LANGFUSE_CONFIGURED: bool = all([LANGFUSE_SECRET_KEY, LANGFUSE_PUBLIC_KEY, LANGFUSE_HOST])
+    TOGETHER_CONFIGURED: bool = bool(TOGETHER_API_KEY)
+    CUSTOM_LLAMA3_AVAILABLE: bool = bool(CUSTOM_LLAMA3_MODEL_ID)
+    
     @classmethod
     def validate(cls) -> bool:
         """Validate that required configuration is present"""
@@ -54,17 +62,17 @@ class Config:
     @classmethod
     def is_langfuse_configured(cls) -> bool:
         """Check if Langfuse is properly configured"""
-        return all([cls.LANGFUSE_SECRET_KEY, cls.LANGFUSE_PUBLIC_KEY, cls.LANGFUSE_HOST])
+        return cls.LANGFUSE_CONFIGURED
     
     @classmethod
     def is_together_configured(cls) -> bool:
         """Check if Together AI is properly configured"""
-        return bool(cls.TOGETHER_API_KEY)
+        return cls.TOGETHER_CONFIGURED
     
     @classmethod
     def has_custom_llama3(cls) -> bool:
         """Check if a custom Llama 3 model is available"""
-        return bool(cls.CUSTOM_LLAMA3_MODEL_ID)
+        return cls.CUSTOM_LLAMA3_AVAILABLE
     
     @classmethod
     def get_env_status(cls) -> dict:
@@ -72,8 +80,8 @@ class Config:
         return {
             "OPENAI_API_KEY": bool(cls.OPENAI_API_KEY),
             "TOGETHER_API_KEY": bool(cls.TOGETHER_API_KEY),
-            "LANGFUSE_CONFIGURED": cls.is_langfuse_configured(),
-            "CUSTOM_MODEL_AVAILABLE": cls.has_custom_llama3(),
+            "LANGFUSE_CONFIGURED": cls.LANGFUSE_CONFIGURED,
+            "CUSTOM_MODEL_AVAILABLE": cls.CUSTOM_LLAMA3_AVAILABLE,
             "TRAINING_DATA_PATH": cls.TRAINING_DATA_PATH,
-            "IS_CLOUD_DEPLOYMENT": bool(os.getenv("STREAMLIT_CLOUD"))
+            "IS_CLOUD_DEPLOYMENT": cls.IS_CLOUD_DEPLOYMENT
         }
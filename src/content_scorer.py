@@ -3,12 +3,49 @@ Content quality scoring and validation system for LinkedIn profiles
 """
 
 import re
-from typing import Dict, List, Tuple, Any
+from typing import TYPE_CHECKING, Dict, List, Tuple, Any
 from dataclasses import dataclass
 
+from .keyword_matcher import KeywordMatcher
+
+# pandas and numpy are imported inside score_profiles_batch, the only place
+# that uses them, so importing this module doesn't pay for loading them
+if TYPE_CHECKING:
+    import pandas as pd
+
+def _basic_experience_dict(exp) -> Dict[str, Any]:
+    """Fallback conversion for experience entries of an unknown format"""
+    return {
+        'title': getattr(exp, 'title', 'Unknown'),
+        'company': getattr(exp, 'company', 'Unknown'),
+        'dates': getattr(exp, 'dates', ''),
+        'description': getattr(exp, 'description', '')
+    }
+
+# Experience entry type -> converter to the dict format used for scoring
+_EXPERIENCE_CONVERTERS = {}
+
+def _register_experience_converter(exp):
+    """Pick and cache the converter for the type of an experience entry"""
+    if hasattr(exp, 'dict'):
+        # Pydantic model
+        convert = lambda e: e.dict()
+    elif hasattr(exp, '__dict__'):
+        # Object with __dict__
+        convert = vars
+    elif isinstance(exp, dict):
+        # Already a dict
+        convert = lambda e: e
+    else:
+        convert = _basic_experience_dict
+    _EXPERIENCE_CONVERTERS[type(exp)] = convert
+    return convert
+
 @dataclass
 class QualityMetrics:
     """Data class for quality metrics"""
+    __slots__ = ('score', 'max_score', 'feedback', 'suggestions')
+    
     score: int
     max_score: int
     feedback: List[str]
@@ -17,6 +54,20 @@ class QualityMetrics:
 class ContentQualityScorer:
     """Advanced content quality scoring system"""
     
+    # Section weights for the overall profile score
+    SECTION_WEIGHTS = {
+        'headline': 0.2,
+        'about': 0.3,
+        'experience': 0.35,
+        'skills': 0.15
+    }
+    
+    # Flat UI result keys per section, in score/max_score/feedback/suggestions order
+    RESULT_KEYS = {
+        section: (f'{section}_score', f'{section}_max_score', f'{section}_feedback', f'{section}_suggestions')
+        for section in ('headline', 'about', 'experience', 'skills', 'overall')
+    }
+    
     def __init__(self):
         self.industry_keywords = {
             "Technology": ["software", "development", "programming", "coding", "tech", "digital", "data", "ai", "ml"],
@@ -26,15 +77,49 @@ class ContentQualityScorer:
             "Sales": ["sales", "revenue", "growth", "client", "business", "account", "relationship"]
         }
         
-        self.action_verbs = [
+        self.action_verbs = frozenset([
             "led", "managed", "developed", "created", "implemented", "launched", 
             "grew", "increased", "reduced", "improved", "optimized", "achieved"
-        ]
+        ])
         
-        self.quantifiable_indicators = [
+        self.quantifiable_indicators = frozenset([
             "%", "$", "number", "count", "increase", "decrease", "growth", "reduction",
             "million", "billion", "thousand", "hundred", "times", "fold"
-        ]
+        ])
+        
+        # Keyword lists matched against lowercased text in a single pass
+        self._industry_matchers = {
+            industry: KeywordMatcher([keyword.lower() for keyword in keywords])
+            for industry, keywords in self.industry_keywords.items()
+        }
+        self._no_industry_matcher = KeywordMatcher([])
+        
+        # Skills are relevant when any keyword occurs in them; one regex search per skill
+        self._industry_skill_res = {
+            industry: self._compile_phrases([keyword.lower() for keyword in keywords])
+            for industry, keywords in self.industry_keywords.items()
+        }
+        self._technical_skill_re = self._compile_phrases(["python", "java", "javascript", "sql", "aws", "docker", "kubernetes"])
+        self._soft_skill_re = self._compile_phrases(["leadership", "communication", "teamwork", "management", "strategy"])
+        self._action_verb_matcher = KeywordMatcher(self.action_verbs)
+        self._quantifiable_matcher = KeywordMatcher(self.quantifiable_indicators)
+        
+        # Experience descriptions are scanned once for verbs, metrics and impact phrases
+        self._impact_phrases = frozenset(["resulted in", "led to", "achieved", "improved", "increased"])
+        self._experience_matcher = KeywordMatcher(
+            list(self.action_verbs | self.quantifiable_indicators | self._impact_phrases)
+        )
+        
+        # Phrase lists matched as substrings of lowercased text, compiled once per scorer
+        self._value_re = self._compile_phrases(["helping", "driving", "delivering", "creating", "solving"])
+        self._passive_re = self._compile_phrases(["looking", "seeking", "unemployed"])
+        self._story_re = self._compile_phrases(["journey", "passion", "mission", "vision", "story"])
+        self._cta_re = self._compile_phrases(["connect", "reach out", "contact", "opportunity", "collaborate"])
+    
+    @staticmethod
+    def _compile_phrases(phrases: List[str]) -> re.Pattern:
+        """Compile a phrase list into a single alternation pattern"""
+        return re.compile("|".join(map(re.escape, phrases)))
     
     def calculate_overall_score(self, profile_data: Dict[str, Any], target_industry: str, target_role: str) -> Dict[str, QualityMetrics]:
         """Calculate comprehensive quality scores for all profile sections"""
@@ -72,23 +157,24 @@ class ContentQualityScorer:
             feedback.append("Headline length is not optimal")
             suggestions.append("Aim for 60-120 characters for maximum impact")
         
+        headline_lower = headline.lower()
+        
         # Value proposition check
-        value_words = ["helping", "driving", "delivering", "creating", "solving"]
-        if any(word in headline.lower() for word in value_words):
+        if self._value_re.search(headline_lower):
             score += 25
         else:
             feedback.append("Missing clear value proposition")
             suggestions.append("Include what value you provide to employers")
         
         # Target role keywords
-        if target_role.lower() in headline.lower():
+        if target_role.lower() in headline_lower:
             score += 25
         else:
             feedback.append("Target role not mentioned")
             suggestions.append(f"Include '{target_role}' in your headline")
         
         # Professional tone
-        if not any(word in headline.lower() for word in ["looking", "seeking", "unemployed"]):
+        if not self._passive_re.search(headline_lower):
             score += 25
         else:
             feedback.append("Avoid passive language")
@@ -111,17 +197,17 @@ class ContentQualityScorer:
             feedback.append(f"About section is {word_count} words (ideal: 300-500)")
             suggestions.append("Expand your about section to 300-500 words")
         
+        about_lower = about.lower()
+        
         # Storytelling elements
-        story_indicators = ["journey", "passion", "mission", "vision", "story"]
-        if any(word in about.lower() for word in story_indicators):
+        if self._story_re.search(about_lower):
             score += 20
         else:
             feedback.append("Missing storytelling elements")
             suggestions.append("Add your career story and passion")
         
         # Industry keywords
-        industry_keywords = self.industry_keywords.get(target_industry, [])
-        keyword_count = sum(1 for keyword in industry_keywords if keyword.lower() in about.lower())
+        keyword_count = self._industry_matchers.get(target_industry, self._no_industry_matcher).count(about_lower)
         if keyword_count >= 3:
             score += 20
         else:
@@ -129,7 +215,7 @@ class ContentQualityScorer:
             suggestions.append(f"Include more {target_industry} industry keywords")
         
         # Quantifiable achievements
-        quant_count = sum(1 for indicator in self.quantifiable_indicators if indicator in about.lower())
+        quant_count = self._quantifiable_matcher.count(about_lower)
         if quant_count >= 2:
             score += 20
         else:
@@ -137,8 +223,7 @@ class ContentQualityScorer:
             suggestions.append("Add specific numbers and metrics")
         
         # Call to action
-        cta_indicators = ["connect", "reach out", "contact", "opportunity", "collaborate"]
-        if any(word in about.lower() for word in cta_indicators):
+        if self._cta_re.search(about_lower):
             score += 20
         else:
             feedback.append("Missing call to action")
@@ -176,8 +261,10 @@ class ContentQualityScorer:
                 company = exp.get('company', '')
                 dates = exp.get('dates', '')
             
+            found = self._experience_matcher.find(description.lower())
+            
             # Action verbs
-            action_count = sum(1 for verb in self.action_verbs if verb in description.lower())
+            action_count = len(found & self.action_verbs)
             if action_count >= 2:
                 exp_score += 8
             else:
@@ -185,7 +272,7 @@ class ContentQualityScorer:
                 suggestions.append("Start bullet points with action verbs")
             
             # Quantifiable results
-            quant_count = sum(1 for indicator in self.quantifiable_indicators if indicator in description.lower())
+            quant_count = len(found & self.quantifiable_indicators)
             if quant_count >= 1:
                 exp_score += 9
             else:
@@ -193,8 +280,7 @@ class ContentQualityScorer:
                 suggestions.append("Add specific numbers and results")
             
             # Impact statements
-            impact_indicators = ["resulted in", "led to", "achieved", "improved", "increased"]
-            if any(indicator in description.lower() for indicator in impact_indicators):
+            if not found.isdisjoint(self._impact_phrases):
                 exp_score += 8
             else:
                 feedback.append(f"Experience '{title}' lacks impact statements")
@@ -225,9 +311,11 @@ class ContentQualityScorer:
             feedback.append(f"Skills count: {len(skills)} (ideal: 10-15)")
             suggestions.append("Aim for 10-15 relevant skills")
         
+        lowered_skills = [skill.lower() for skill in skills]
+        
         # Industry relevance
-        industry_keywords = self.industry_keywords.get(target_industry, [])
-        relevant_skills = [skill for skill in skills if any(keyword in skill.lower() for keyword in industry_keywords)]
+        industry_skill_re = self._industry_skill_res.get(target_industry)
+        relevant_skills = [skill for skill in lowered_skills if industry_skill_re.search(skill)] if industry_skill_re else []
         
         if len(relevant_skills) >= 5:
             score += 40
@@ -236,11 +324,8 @@ class ContentQualityScorer:
             suggestions.append(f"Add more {target_industry} specific skills")
         
         # Skill diversity (technical vs soft)
-        technical_indicators = ["python", "java", "javascript", "sql", "aws", "docker", "kubernetes"]
-        soft_indicators = ["leadership", "communication", "teamwork", "management", "strategy"]
-        
-        technical_skills = [skill for skill in skills if any(indicator in skill.lower() for indicator in technical_indicators)]
-        soft_skills = [skill for skill in skills if any(indicator in skill.lower() for indicator in soft_indicators)]
+        technical_skills = any(map(self._technical_skill_re.search, lowered_skills))
+        soft_skills = any(map(self._soft_skill_re.search, lowered_skills))
         
         if technical_skills and soft_skills:
             score += 30
@@ -252,23 +337,20 @@ class ContentQualityScorer:
     
     def _calculate_overall_profile_score(self, section_scores: Dict[str, QualityMetrics]) -> QualityMetrics:
         """Calculate overall profile quality score"""
-        weights = {
-            'headline': 0.2,
-            'about': 0.3,
-            'experience': 0.35,
-            'skills': 0.15
-        }
+        weights = self.SECTION_WEIGHTS
         
         total_score = 0
         all_feedback = []
         all_suggestions = []
+        extend_feedback = all_feedback.extend
+        extend_suggestions = all_suggestions.extend
         
         for section, score_obj in section_scores.items():
-            if section in weights:
-                weight = weights[section]
+            weight = weights.get(section)
+            if weight is not None:
                 total_score += (score_obj.score / 100) * weight * 100
-                all_feedback.extend(score_obj.feedback)
-                all_suggestions.extend(score_obj.suggestions)
+                extend_feedback(score_obj.feedback)
+                extend_suggestions(score_obj.suggestions)
         
         return QualityMetrics(
             int(total_score),
@@ -279,30 +361,97 @@ class ContentQualityScorer:
     
     def score_profile_content(self, profile_data, target_industry: str = "Technology", target_role: str = "Software Engineer") -> Dict[str, Any]:
         """Score profile content - wrapper for calculate_overall_score"""
+        profile_dict = self._profile_to_dict(profile_data)
+        
+        # Calculate scores using existing method
+        scores = self.calculate_overall_score(profile_dict, target_industry, target_role)
+        
+        # Convert to simple dict format for UI
+        result_keys = self.RESULT_KEYS
+        return {
+            key: value
+            for section, metrics in scores.items()
+            for key, value in zip(
+                result_keys[section],
+                (metrics.score, metrics.max_score, metrics.feedback, metrics.suggestions)
+            )
+        }
+    
+    def score_profiles_batch(self, profiles: List[Any], target_industry: str = "Technology", target_role: str = "Software Engineer") -> "pd.DataFrame":
+        """
+        Score many profiles at once, returning one row of section scores per profile
+        
+        Headline and About checks run as vectorized pandas string operations across
+        all profiles; experience and skills are scored per profile. Scores match
+        calculate_overall_score, without feedback or suggestions.
+        """
+        try:
+            import numpy as np
+            import pandas as pd
+        except ImportError:
+            raise ImportError("pandas is required for batch scoring")
+        
+        profile_dicts = [self._profile_to_dict(profile) for profile in profiles]
+        headlines_raw = pd.Series([p.get('headline') or '' for p in profile_dicts], dtype=object)
+        headlines = headlines_raw.str.lower()
+        abouts_raw = pd.Series([p.get('about') or '' for p in profile_dicts], dtype=object)
+        abouts = abouts_raw.str.lower()
+        
+        def contains(series, pattern):
+            return series.str.contains(pattern, regex=True).astype(int)
+        
+        def keyword_hits(series, keywords):
+            hits = pd.Series(0, index=series.index)
+            for keyword in keywords:
+                hits += series.str.contains(keyword, regex=False).astype(int)
+            return hits
+        
+        scores = pd.DataFrame(index=range(len(profile_dicts)))
+        
+        # Length of the raw text; lowercasing can change the length of non-ASCII text
+        headline_length = headlines_raw.str.len()
+        scores['headline_score'] = (
+            headline_length.between(60, 120).astype(int) * 25
+            + contains(headlines, self._value_re) * 25
+            + headlines.str.contains(target_role.lower(), regex=False).astype(int) * 25
+            + (1 - contains(headlines, self._passive_re)) * 25
+        )
+        
+        industry_matcher = self._industry_matchers.get(target_industry, self._no_industry_matcher)
+        industry_hits = keyword_hits(abouts, industry_matcher.keywords)
+        scores['about_score'] = (
+            abouts_raw.str.split().str.len().between(300, 500).astype(int) * 20
+            + contains(abouts, self._story_re) * 20
+            + (industry_hits >= 3).astype(int) * 20
+            + (keyword_hits(abouts, self._quantifiable_matcher.keywords) >= 2).astype(int) * 20
+            + contains(abouts, self._cta_re) * 20
+        )
+        
+        scores['experience_score'] = [
+            self._score_experience_section(p.get('experience', [])).score for p in profile_dicts
+        ]
+        scores['skills_score'] = [
+            self._score_skills_section(p.get('skills', []), target_industry).score for p in profile_dicts
+        ]
+        
+        # (N, 4) section matrix in SECTION_WEIGHTS order, weighted row-wise in one pass
+        section_columns = [f'{section}_score' for section in self.SECTION_WEIGHTS]
+        weights = np.fromiter(self.SECTION_WEIGHTS.values(), dtype=np.float64)
+        weighted = (scores[section_columns].to_numpy(dtype=np.float64) / 100) * weights * 100
+        scores['overall_score'] = weighted.sum(axis=1).astype(np.int64)
+        
+        return scores
+    
+    def _profile_to_dict(self, profile_data) -> Dict[str, Any]:
+        """Convert a LinkedInProfile-like object to the dict format used for scoring"""
         # Convert LinkedInProfile to dict if needed
         if hasattr(profile_data, 'headline'):
             # Handle Pydantic models - convert to dict format
             experience_list = []
             if hasattr(profile_data, 'experience') and profile_data.experience:
                 for exp in profile_data.experience:
-                    if hasattr(exp, 'dict'):
-                        # Pydantic model
-                        exp_dict = exp.dict()
-                    elif hasattr(exp, '__dict__'):
-                        # Object with __dict__
-                        exp_dict = exp.__dict__
-                    elif isinstance(exp, dict):
-                        # Already a dict
-                        exp_dict = exp
-                    else:
-                        # Unknown format, create basic dict
-                        exp_dict = {
-                            'title': getattr(exp, 'title', 'Unknown'),
-                            'company': getattr(exp, 'company', 'Unknown'),
-                            'dates': getattr(exp, 'dates', ''),
-                            'description': getattr(exp, 'description', '')
-                        }
-                    experience_list.append(exp_dict)
+                    convert = _EXPERIENCE_CONVERTERS.get(type(exp)) or _register_experience_converter(exp)
+                    experience_list.append(convert(exp))
             
             profile_dict = {
                 'headline': profile_data.headline,
@@ -313,18 +462,7 @@ class ContentQualityScorer:
         else:
             profile_dict = profile_data
         
-        # Calculate scores using existing method
-        scores = self.calculate_overall_score(profile_dict, target_industry, target_role)
-        
-        # Convert to simple dict format for UI
-        result = {}
-        for section, metrics in scores.items():
-            result[f'{section}_score'] = metrics.score
-            result[f'{section}_max_score'] = metrics.max_score
-            result[f'{section}_feedback'] = metrics.feedback
-            result[f'{section}_suggestions'] = metrics.suggestions
-        
-        return result
+        return profile_dict
     
     def get_quality_recommendations(self, quality_scores: Dict[str, Any]) -> List[str]:
         """Get quality recommendations based on scores"""
@@ -343,7 +481,7 @@ class ContentQualityScorer:
                     feedback = quality_scores.get(feedback_key, [])
                     recommendations.extend(feedback)
         
-        return list(set(recommendations))  # Remove duplicates
+        return list(dict.fromkeys(recommendations))  # Remove duplicates, keep section order
     
     def validate_content(self, content: str, content_type: str) -> Dict[str, Any]:
         """Real-time content validation"""
@@ -371,15 +509,17 @@ class ContentQualityScorer:
             elif length > limit['max']:
                 validation_result['warnings'].append(f"Quite long - consider reducing to {limit['max']} characters")
         
+        content_lower = content.lower()
+        
         # Common issues
-        if "looking for" in content.lower():
+        if "looking for" in content_lower:
             validation_result['warnings'].append("Avoid passive language like 'looking for'")
         
         if content.count('!') > 2:
             validation_result['warnings'].append("Too many exclamation marks")
         
         # Suggestions
-        if not any(verb in content.lower() for verb in self.action_verbs):
+        if not self._action_verb_matcher.count(content_lower):
             validation_result['suggestions'].append("Add more action verbs")
         
         return validation_result
@@ -3,8 +3,37 @@ Content quality validation system for LinkedIn optimization outputs
 """
 
 import re
+from functools import lru_cache
 from typing import Dict, List, Tuple, Any
 from .prompt_templates import INDUSTRY_DATA
+from .keyword_matcher import KeywordMatcher
+
+# Patterns used on every validation call, compiled once. Metric patterns open
+# with a [$\d] class so the regex engine can skip ahead to candidate positions;
+# the lookbehinds pick the '$' or digit branch, and matches are the same as
+# \$\d+|\d+(?:...).
+_HEADLINE_METRIC_RE = re.compile(r'[$\d](?:(?<=\$)\d+|(?<=\d)\d*(?:%| years?))')
+_METRIC_RE = re.compile(r'[$\d](?:(?<=\$)\d+|(?<=\d)\d*(?:%| (?:years?|months?|people|projects|teams)))')
+# Non-blank text between bullet markers, i.e. the non-empty pieces of re.split(r'[-•*]\s*')
+_BULLET_ITEM_RE = re.compile(r'[^-•*\s][^-•*]*')
+_ACTION_VERB_RE = re.compile(
+    r'\b(led|managed|developed|created|implemented|optimized|achieved|increased|reduced|improved)\b',
+    re.IGNORECASE
+)
+_UNPROFESSIONAL_WORDS = ('awesome', 'cool', 'stuff', 'things', 'etc', 'blah', 'lol')
+_UNPROFESSIONAL_MATCHER = KeywordMatcher(_UNPROFESSIONAL_WORDS)
+
+# Industry keywords and per-role skills as sets, built once from INDUSTRY_DATA
+_INDUSTRY_INDEX = {
+    industry: {
+        "keywords": frozenset(industry_info["keywords"]),
+        "role_skills": {
+            role: frozenset(role_info.get("skills", []))
+            for role, role_info in industry_info["role_specific"].items()
+        }
+    }
+    for industry, industry_info in INDUSTRY_DATA.items()
+}
 
 class ContentQualityValidator:
     """Validates and scores LinkedIn optimization content quality"""
@@ -31,46 +60,68 @@ class ContentQualityValidator:
         Returns:
             Tuple of (score_out_of_100, feedback_list)
         """
+        score, feedback, _ = self._validate_content_sections(content, target_industry, target_role)
+        return score, feedback
+    
+    def _validate_content_sections(self, content: Dict[str, Any], target_industry: str, target_role: str) -> Tuple[int, List[str], set]:
+        """Validate content quality, also returning the sections that failed a section check"""
         score = 0
         feedback = []
+        failed_sections = set()
         
         # Get industry data for validation
-        industry_info = INDUSTRY_DATA.get(target_industry, INDUSTRY_DATA["Technology"])
-        industry_keywords = set(industry_info["keywords"])
-        role_skills = set(industry_info["role_specific"].get(target_role, {}).get("skills", []))
+        industry_keywords, role_skills = self._get_industry_sets(target_industry, target_role)
+        
+        # Lowercase once for the section and overall checks
+        headline = content.get("headline", "")
+        about = content.get("about", "")
+        headline_lower = headline.lower()
+        about_lower = about.lower()
         
         # 1. Validate Headline
-        headline_score, headline_feedback = self._validate_headline(content.get("headline", ""), industry_keywords)
+        headline_score, headline_feedback = self._validate_headline(headline, headline_lower, industry_keywords, failed_sections)
         score += headline_score
         feedback.extend(headline_feedback)
         
         # 2. Validate About Section
-        about_score, about_feedback = self._validate_about_section(content.get("about", ""), industry_keywords, role_skills)
+        about_score, about_feedback = self._validate_about_section(
+            about, about_lower, industry_keywords, role_skills, failed_sections
+        )
         score += about_score
         feedback.extend(about_feedback)
         
         # 3. Validate Experience Section
-        experience_score, experience_feedback = self._validate_experience_section(
-            content.get("experience", []), industry_keywords
-        )
+        experience_score, experience_feedback = self._validate_experience_section(content.get("experience", []), failed_sections)
         score += experience_score
         feedback.extend(experience_feedback)
         
         # 4. Validate Skills Section
         skills_score, skills_feedback = self._validate_skills_section(
-            content.get("skills", []), role_skills
+            content.get("skills", []), role_skills, failed_sections
         )
         score += skills_score
         feedback.extend(skills_feedback)
         
         # 5. Overall Content Quality
-        overall_score, overall_feedback = self._validate_overall_quality(content)
+        overall_score, overall_feedback = self._validate_overall_quality(content, headline_lower, about_lower)
         score += overall_score
         feedback.extend(overall_feedback)
         
-        return min(score, 100), feedback
+        return min(score, 100), feedback, failed_sections
+    
+    @staticmethod
+    def _get_industry_sets(target_industry: str, target_role: str) -> Tuple[frozenset, frozenset]:
+        """Industry keywords and role skills for validation"""
+        industry_entry = _INDUSTRY_INDEX.get(target_industry, _INDUSTRY_INDEX["Technology"])
+        return industry_entry["keywords"], industry_entry["role_skills"].get(target_role, frozenset())
+    
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _get_keyword_matcher(keywords: frozenset) -> KeywordMatcher:
+        """Lowercased single-pass matcher for a keyword set"""
+        return KeywordMatcher([keyword.lower() for keyword in keywords])
     
-    def _validate_headline(self, headline: str, industry_keywords: set) -> Tuple[int, List[str]]:
+    def _validate_headline(self, headline: str, headline_lower: str, industry_keywords: set, failed_sections: set) -> Tuple[int, List[str]]:
         """Validate headline quality"""
         score = 0
         feedback = []
@@ -80,23 +131,26 @@ class ContentQualityValidator:
             score += 10
         else:
             feedback.append(f"❌ Headline too long ({len(headline)} chars). Max: {self.min_requirements['headline_max_length']}")
+            failed_sections.add("headline")
         
         # Industry keywords check
-        keyword_count = len([kw for kw in industry_keywords if kw.lower() in headline.lower()])
+        keyword_count = self._get_keyword_matcher(industry_keywords).count(headline_lower)
         if keyword_count >= 1:
             score += 10
         else:
             feedback.append("❌ Headline should include at least 1 industry keyword")
+            failed_sections.add("headline")
         
         # Quantifiable metrics check
-        if re.search(r'\d+%|\$\d+|\d+ years?', headline):
+        if _HEADLINE_METRIC_RE.search(headline):
             score += 10
         else:
             feedback.append("❌ Headline should include a quantifiable achievement (%, $, or numbers)")
+            failed_sections.add("headline")
         
         return score, feedback
     
-    def _validate_about_section(self, about: str, industry_keywords: set, role_skills: set) -> Tuple[int, List[str]]:
+    def _validate_about_section(self, about: str, about_lower: str, industry_keywords: set, role_skills: set, failed_sections: set) -> Tuple[int, List[str]]:
         """Validate about section quality"""
         score = 0
         feedback = []
@@ -106,33 +160,38 @@ class ContentQualityValidator:
             score += 15
         elif len(about) < self.min_requirements["about_min_length"]:
             feedback.append(f"❌ About section too short ({len(about)} chars). Min: {self.min_requirements['about_min_length']}")
+            failed_sections.add("about")
         else:
             feedback.append(f"❌ About section too long ({len(about)} chars). Max: {self.min_requirements['about_max_length']}")
+            failed_sections.add("about")
         
         # Industry keywords check
-        keyword_count = len([kw for kw in industry_keywords if kw.lower() in about.lower()])
+        keyword_count = self._get_keyword_matcher(industry_keywords).count(about_lower)
         if keyword_count >= 3:
             score += 10
         else:
             feedback.append(f"❌ About section should include at least 3 industry keywords (found: {keyword_count})")
+            failed_sections.add("about")
         
         # Role skills check
-        skill_count = len([skill for skill in role_skills if skill.lower() in about.lower()])
+        skill_count = self._get_keyword_matcher(role_skills).count(about_lower)
         if skill_count >= 2:
             score += 10
         else:
             feedback.append(f"❌ About section should include at least 2 role-specific skills (found: {skill_count})")
+            failed_sections.add("about")
         
         # Quantifiable achievements check
-        metric_count = len(re.findall(r'\d+%|\$\d+|\d+ (?:years?|months?|people|projects|teams)', about))
+        metric_count = len(_METRIC_RE.findall(about))
         if metric_count >= 3:
             score += 15
         else:
             feedback.append(f"❌ About section should include at least 3 quantifiable achievements (found: {metric_count})")
+            failed_sections.add("about")
         
         return score, feedback
     
-    def _validate_experience_section(self, experiences: List[Dict], industry_keywords: set) -> Tuple[int, List[str]]:
+    def _validate_experience_section(self, experiences: List[Dict], failed_sections: set) -> Tuple[int, List[str]]:
         """Validate experience section quality"""
         score = 0
         feedback = []
@@ -140,33 +199,27 @@ class ContentQualityValidator:
         total_metrics = 0
         
         for i, exp in enumerate(experiences):
-            achievements = 0
-            metrics = 0
-            
             description = exp.get("description", "")
             
             # Check for bullet points (achievements)
-            bullet_points = re.split(r'[-•*]\s*', description)
-            bullet_points = [bp.strip() for bp in bullet_points if bp.strip()]
-            achievements = len(bullet_points)
+            achievements = sum(1 for _ in _BULLET_ITEM_RE.finditer(description))
             total_achievements += achievements
             
             # Check for quantifiable metrics
-            metrics = len(re.findall(r'\d+%|\$\d+|\d+ (?:years?|months?|people|projects|teams)', description))
+            metrics = len(_METRIC_RE.findall(description))
             total_metrics += metrics
             
-            # Industry keywords in experience
-            keyword_count = len([kw for kw in industry_keywords if kw.lower() in description.lower()])
-            
             if achievements >= 3:
                 score += 5
             else:
                 feedback.append(f"❌ Experience {i+1} should have at least 3 bullet points (found: {achievements})")
+                failed_sections.add("experience")
             
             if metrics >= 2:
                 score += 5
             else:
                 feedback.append(f"❌ Experience {i+1} should include at least 2 metrics (found: {metrics})")
+                failed_sections.add("experience")
         
         # Overall experience validation
         if total_achievements >= len(experiences) * 3:
@@ -181,7 +234,7 @@ class ContentQualityValidator:
         
         return score, feedback
     
-    def _validate_skills_section(self, skills: List[str], role_skills: set) -> Tuple[int, List[str]]:
+    def _validate_skills_section(self, skills: List[str], role_skills: set, failed_sections: set) -> Tuple[int, List[str]]:
         """Validate skills section quality"""
         score = 0
         feedback = []
@@ -192,15 +245,17 @@ class ContentQualityValidator:
             score += 15
         else:
             feedback.append(f"❌ Skills section should include at least 3 role-specific skills (found: {len(found_role_skills)})")
+            failed_sections.add("skills")
         
         # Total skills count
         if len(skills) >= 10:
             score += 10
         else:
             feedback.append(f"❌ Skills section should include at least 10 skills (found: {len(skills)})")
+            failed_sections.add("skills")
         
         # Skills categorization (technical, business, leadership)
-        technical_skills = [s for s in skills if any(tech in s.lower() for tech in ['python', 'java', 'javascript', 'aws', 'azure', 'sql', 'react'])]
+        technical_skills = [s for s in map(str.lower, skills) if any(tech in s for tech in ['python', 'java', 'javascript', 'aws', 'azure', 'sql', 'react'])]
         if len(technical_skills) >= 3:
             score += 5
         else:
@@ -208,7 +263,7 @@ class ContentQualityValidator:
         
         return score, feedback
     
-    def _validate_overall_quality(self, content: Dict[str, Any]) -> Tuple[int, List[str]]:
+    def _validate_overall_quality(self, content: Dict[str, Any], headline_lower: str, about_lower: str) -> Tuple[int, List[str]]:
         """Validate overall content quality"""
         score = 0
         feedback = []
@@ -222,22 +277,24 @@ class ContentQualityValidator:
         else:
             feedback.append(f"❌ Missing required sections: {', '.join(missing_sections)}")
         
-        # Check for action-oriented language
-        all_text = " ".join([
-            content.get("headline", ""),
-            content.get("about", ""),
-            " ".join([exp.get("description", "") for exp in content.get("experience", [])])
-        ])
+        # Scan each section once for action verbs and unprofessional words
+        descriptions = [exp.get("description", "") for exp in content.get("experience", [])]
+        section_texts = [content.get("headline", ""), content.get("about", "")] + descriptions
+        lowered_texts = [headline_lower, about_lower] + [description.lower() for description in descriptions]
+        
+        action_verbs = 0
+        found_words = set()
+        for text, text_lower in zip(section_texts, lowered_texts):
+            action_verbs += len(_ACTION_VERB_RE.findall(text))
+            found_words |= _UNPROFESSIONAL_MATCHER.find(text_lower)
         
-        action_verbs = len(re.findall(r'\b(led|managed|developed|created|implemented|optimized|achieved|increased|reduced|improved)\b', all_text, re.IGNORECASE))
         if action_verbs >= 5:
             score += 10
         else:
             feedback.append(f"❌ Include more action verbs (found: {action_verbs})")
         
         # Check for professional tone
-        unprofessional_words = ['awesome', 'cool', 'stuff', 'things', 'etc', 'blah', 'lol']
-        found_unprofessional = [word for word in unprofessional_words if word in all_text.lower()]
+        found_unprofessional = [word for word in _UNPROFESSIONAL_WORDS if word in found_words]
         
         if not found_unprofessional:
             score += 10
@@ -248,7 +305,7 @@ class ContentQualityValidator:
     
     def generate_improvement_suggestions(self, content: Dict[str, Any], target_industry: str, target_role: str) -> List[str]:
         """Generate specific improvement suggestions"""
-        score, feedback = self.validate_content_quality(content, target_industry, target_role)
+        score, feedback, failed_sections = self._validate_content_sections(content, target_industry, target_role)
         
         if score >= 80:
             return ["✅ Content quality is excellent! Ready for implementation."]
@@ -257,19 +314,19 @@ class ContentQualityValidator:
         industry_info = INDUSTRY_DATA.get(target_industry, INDUSTRY_DATA["Technology"])
         
         # Headline suggestions
-        if "❌ Headline" in " ".join(feedback):
+        if "headline" in failed_sections:
             suggestions.append(f"🎯 Headline: Add a quantifiable achievement and 1+ industry keywords like {industry_info['keywords'][:3]}")
         
         # About section suggestions
-        if "❌ About section" in " ".join(feedback):
+        if "about" in failed_sections:
             suggestions.append(f"📝 About: Add 3+ specific achievements with metrics (%, $, numbers) and industry keywords")
         
         # Experience suggestions
-        if "❌ Experience" in " ".join(feedback):
+        if "experience" in failed_sections:
             suggestions.append("💼 Experience: Rewrite bullet points with 'Achieved X% improvement' format")
         
         # Skills suggestions
-        if "❌ Skills section" in " ".join(feedback):
+        if "skills" in failed_sections:
             role_skills = industry_info["role_specific"].get(target_role, {}).get("skills", [])
             suggestions.append(f"🔧 Skills: Add role-specific skills like {role_skills[:5]}")
         
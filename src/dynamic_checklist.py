@@ -3,15 +3,27 @@ Dynamic checklist generation based on profile analysis
 """
 
 import re
+from itertools import chain
 from typing import Dict, List, Any, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 
+# Metric indicators matched as substrings, case-insensitively, in one pass
+_METRIC_INDICATOR_RE = re.compile(r'[%$]|number|increased|decreased', re.IGNORECASE)
+_TIME_RE = re.compile(r'(\d+)')
+
 class TaskPriority(Enum):
     HIGH = "high"
     MEDIUM = "medium"
     LOW = "low"
 
+# Sort ranks, most important first
+_PRIORITY_RANK = {TaskPriority.HIGH: 0, TaskPriority.MEDIUM: 1, TaskPriority.LOW: 2}
+_IMPACT_RANK = {"High": 0, "Medium": 1, "Low": 2}
+
+# Preformatted ids for typical checklist sizes
+_TASK_IDS = tuple(f"task_{i}" for i in range(1, 129))
+
 @dataclass
 class ChecklistTask:
     """Individual checklist task"""
@@ -24,196 +36,252 @@ class ChecklistTask:
     section: str
     dependencies: List[str] = None
     completed: bool = False
+    estimated_minutes: int = None
+    
+    def __post_init__(self):
+        # Parse the time estimate once (e.g., "15 min" -> 15)
+        if self.estimated_minutes is None:
+            time_match = _TIME_RE.search(self.estimated_time)
+            self.estimated_minutes = int(time_match.group(1)) if time_match else 0
+
+# Template tasks per profile issue, shared by every generator instance
+TASK_TEMPLATES = {
+    'headline_issues': [
+        {
+            'title': '📝 Optimize Headline Length',
+            'description': 'Adjust headline to 60-120 characters for maximum impact',
+            'priority': TaskPriority.HIGH,
+            'time': '5 min',
+            'impact': 'High'
+        },
+        {
+            'title': '🎯 Add Value Proposition',
+            'description': 'Include clear value proposition showing what you bring to employers',
+            'priority': TaskPriority.HIGH,
+            'time': '10 min',
+            'impact': 'High'
+        },
+        {
+            'title': '🔍 Include Target Role Keywords',
+            'description': 'Add specific keywords related to your target role',
+            'priority': TaskPriority.HIGH,
+            'time': '5 min',
+            'impact': 'High'
+        }
+    ],
+    'about_issues': [
+        {
+            'title': '📄 Expand About Section',
+            'description': 'Increase word count to 300-500 words for comprehensive coverage',
+            'priority': TaskPriority.HIGH,
+            'time': '15 min',
+            'impact': 'High'
+        },
+        {
+            'title': '📖 Add Storytelling Elements',
+            'description': 'Include career journey, passion, and professional narrative',
+            'priority': TaskPriority.MEDIUM,
+            'time': '20 min',
+            'impact': 'Medium'
+        },
+        {
+            'title': '📊 Add Quantifiable Achievements',
+            'description': 'Include specific numbers, percentages, and measurable outcomes',
+            'priority': TaskPriority.HIGH,
+            'time': '10 min',
+            'impact': 'High'
+        },
+        {
+            'title': '🎯 Add Industry Keywords',
+            'description': 'Include more industry-specific terminology',
+            'priority': TaskPriority.MEDIUM,
+            'time': '10 min',
+            'impact': 'Medium'
+        },
+        {
+            'title': '📞 Add Call to Action',
+            'description': 'Include clear call to action for recruiters and connections',
+            'priority': TaskPriority.MEDIUM,
+            'time': '5 min',
+            'impact': 'Medium'
+        }
+    ],
+    'experience_issues': [
+        {
+            'title': '💼 Add Action Verbs',
+            'description': 'Start bullet points with strong action verbs',
+            'priority': TaskPriority.HIGH,
+            'time': '15 min',
+            'impact': 'High'
+        },
+        {
+            'title': '📈 Add Metrics and Results',
+            'description': 'Include specific numbers, percentages, and quantifiable outcomes',
+            'priority': TaskPriority.HIGH,
+            'time': '20 min',
+            'impact': 'High'
+        },
+        {
+            'title': '🎯 Add Impact Statements',
+            'description': 'Show the impact and results of your work',
+            'priority': TaskPriority.HIGH,
+            'time': '15 min',
+            'impact': 'High'
+        },
+        {
+            'title': '📝 Enhance Descriptions',
+            'description': 'Improve job descriptions with more detail and achievements',
+            'priority': TaskPriority.MEDIUM,
+            'time': '25 min',
+            'impact': 'Medium'
+        }
+    ],
+    'skills_issues': [
+        {
+            'title': '🎯 Add Industry-Specific Skills',
+            'description': 'Include more skills relevant to your target industry',
+            'priority': TaskPriority.HIGH,
+            'time': '10 min',
+            'impact': 'High'
+        },
+        {
+            'title': '⚖️ Balance Technical and Soft Skills',
+            'description': 'Ensure good mix of technical and interpersonal skills',
+            'priority': TaskPriority.MEDIUM,
+            'time': '10 min',
+            'impact': 'Medium'
+        },
+        {
+            'title': '📊 Add Missing Key Skills',
+            'description': 'Include essential skills for your target role',
+            'priority': TaskPriority.HIGH,
+            'time': '15 min',
+            'impact': 'High'
+        }
+    ],
+    'general_optimization': [
+        {
+            'title': '📱 Get Recommendations',
+            'description': 'Request recommendations from managers and colleagues',
+            'priority': TaskPriority.MEDIUM,
+            'time': '20 min',
+            'impact': 'Medium'
+        },
+        {
+            'title': '📅 Plan Content Strategy',
+            'description': 'Create 30-day content and engagement plan',
+            'priority': TaskPriority.LOW,
+            'time': '30 min',
+            'impact': 'Low'
+        },
+        {
+            'title': '🔍 Optimize Keywords',
+            'description': 'Ensure consistent keyword usage throughout profile',
+            'priority': TaskPriority.MEDIUM,
+            'time': '15 min',
+            'impact': 'Medium'
+        },
+        {
+            'title': '📊 Add Measurable Outcomes',
+            'description': 'Add specific metrics and achievements throughout',
+            'priority': TaskPriority.HIGH,
+            'time': '25 min',
+            'impact': 'High'
+        }
+    ]
+}
+
+# Tasks emitted by the section analyzers, built once; analyzers copy them with
+# dataclasses.replace, filling in per-profile text where needed
+TASK_CATALOG = {
+    'headline_create': ChecklistTask(
+        id="", title="📝 Create Compelling Headline",
+        description="Write a headline that's 60-120 characters and includes your value proposition",
+        priority=TaskPriority.HIGH, estimated_time="10 min", impact_level="High", section="Headline"
+    ),
+    'headline_value_proposition': ChecklistTask(
+        id="", title="🎯 Add Value Proposition",
+        description="Include what value you bring to potential employers",
+        priority=TaskPriority.HIGH, estimated_time="5 min", impact_level="High", section="Headline"
+    ),
+    'about_expand': ChecklistTask(
+        id="", title="📄 Expand About Section",
+        description="Expand to 300-500 words with more detail",
+        priority=TaskPriority.HIGH, estimated_time="20 min", impact_level="High", section="About"
+    ),
+    'about_story': ChecklistTask(
+        id="", title="📖 Add Career Story",
+        description="Add your professional journey and passion narrative",
+        priority=TaskPriority.MEDIUM, estimated_time="15 min", impact_level="Medium", section="About"
+    ),
+    'about_achievements': ChecklistTask(
+        id="", title="📊 Add Measurable Achievements",
+        description="Include specific numbers and achievements in your story",
+        priority=TaskPriority.HIGH, estimated_time="10 min", impact_level="High", section="About"
+    ),
+    'experience_add': ChecklistTask(
+        id="", title="💼 Add Experience Entries",
+        description="Add your work experience with detailed descriptions",
+        priority=TaskPriority.HIGH, estimated_time="30 min", impact_level="High", section="Experience"
+    ),
+    'experience_metrics': ChecklistTask(
+        id="", title="📈 Add Metrics",
+        description="Add specific numbers and results to this experience",
+        priority=TaskPriority.HIGH, estimated_time="10 min", impact_level="High", section="Experience"
+    ),
+    'experience_action_verbs': ChecklistTask(
+        id="", title="⚡ Add Action Verbs",
+        description="Start bullet points with strong action verbs",
+        priority=TaskPriority.HIGH, estimated_time="15 min", impact_level="High", section="Experience"
+    ),
+    'skills_add': ChecklistTask(
+        id="", title="🎯 Add More Skills",
+        description="Add more relevant skills to reach optimal count",
+        priority=TaskPriority.HIGH, estimated_time="10 min", impact_level="High", section="Skills"
+    ),
+    'skills_industry': ChecklistTask(
+        id="", title="🔍 Add Industry-Specific Skills",
+        description="Add more industry specific skills",
+        priority=TaskPriority.HIGH, estimated_time="15 min", impact_level="High", section="Skills"
+    ),
+    'general_recommendations': ChecklistTask(
+        id="", title="📱 Get Recommendations",
+        description="Request recommendations from managers and colleagues",
+        priority=TaskPriority.MEDIUM, estimated_time="20 min", impact_level="Medium", section="General"
+    ),
+    'general_content_strategy': ChecklistTask(
+        id="", title="📅 Plan Content Strategy",
+        description="Create 30-day content and engagement plan",
+        priority=TaskPriority.LOW, estimated_time="30 min", impact_level="Low", section="General"
+    )
+}
 
 class DynamicChecklistGenerator:
     """Generate personalized checklist based on profile analysis"""
     
     def __init__(self):
-        self.task_templates = {
-            'headline_issues': [
-                {
-                    'title': '📝 Optimize Headline Length',
-                    'description': 'Adjust headline to 60-120 characters for maximum impact',
-                    'priority': TaskPriority.HIGH,
-                    'time': '5 min',
-                    'impact': 'High'
-                },
-                {
-                    'title': '🎯 Add Value Proposition',
-                    'description': 'Include clear value proposition showing what you bring to employers',
-                    'priority': TaskPriority.HIGH,
-                    'time': '10 min',
-                    'impact': 'High'
-                },
-                {
-                    'title': '🔍 Include Target Role Keywords',
-                    'description': 'Add specific keywords related to your target role',
-                    'priority': TaskPriority.HIGH,
-                    'time': '5 min',
-                    'impact': 'High'
-                }
-            ],
-            'about_issues': [
-                {
-                    'title': '📄 Expand About Section',
-                    'description': 'Increase word count to 300-500 words for comprehensive coverage',
-                    'priority': TaskPriority.HIGH,
-                    'time': '15 min',
-                    'impact': 'High'
-                },
-                {
-                    'title': '📖 Add Storytelling Elements',
-                    'description': 'Include career journey, passion, and professional narrative',
-                    'priority': TaskPriority.MEDIUM,
-                    'time': '20 min',
-                    'impact': 'Medium'
-                },
-                {
-                    'title': '📊 Add Quantifiable Achievements',
-                    'description': 'Include specific numbers, percentages, and measurable outcomes',
-                    'priority': TaskPriority.HIGH,
-                    'time': '10 min',
-                    'impact': 'High'
-                },
-                {
-                    'title': '🎯 Add Industry Keywords',
-                    'description': 'Include more industry-specific terminology',
-                    'priority': TaskPriority.MEDIUM,
-                    'time': '10 min',
-                    'impact': 'Medium'
-                },
-                {
-                    'title': '📞 Add Call to Action',
-                    'description': 'Include clear call to action for recruiters and connections',
-                    'priority': TaskPriority.MEDIUM,
-                    'time': '5 min',
-                    'impact': 'Medium'
-                }
-            ],
-            'experience_issues': [
-                {
-                    'title': '💼 Add Action Verbs',
-                    'description': 'Start bullet points with strong action verbs',
-                    'priority': TaskPriority.HIGH,
-                    'time': '15 min',
-                    'impact': 'High'
-                },
-                {
-                    'title': '📈 Add Metrics and Results',
-                    'description': 'Include specific numbers, percentages, and quantifiable outcomes',
-                    'priority': TaskPriority.HIGH,
-                    'time': '20 min',
-                    'impact': 'High'
-                },
-                {
-                    'title': '🎯 Add Impact Statements',
-                    'description': 'Show the impact and results of your work',
-                    'priority': TaskPriority.HIGH,
-                    'time': '15 min',
-                    'impact': 'High'
-                },
-                {
-                    'title': '📝 Enhance Descriptions',
-                    'description': 'Improve job descriptions with more detail and achievements',
-                    'priority': TaskPriority.MEDIUM,
-                    'time': '25 min',
-                    'impact': 'Medium'
-                }
-            ],
-            'skills_issues': [
-                {
-                    'title': '🎯 Add Industry-Specific Skills',
-                    'description': 'Include more skills relevant to your target industry',
-                    'priority': TaskPriority.HIGH,
-                    'time': '10 min',
-                    'impact': 'High'
-                },
-                {
-                    'title': '⚖️ Balance Technical and Soft Skills',
-                    'description': 'Ensure good mix of technical and interpersonal skills',
-                    'priority': TaskPriority.MEDIUM,
-                    'time': '10 min',
-                    'impact': 'Medium'
-                },
-                {
-                    'title': '📊 Add Missing Key Skills',
-                    'description': 'Include essential skills for your target role',
-                    'priority': TaskPriority.HIGH,
-                    'time': '15 min',
-                    'impact': 'High'
-                }
-            ],
-            'general_optimization': [
-                {
-                    'title': '📱 Get Recommendations',
-                    'description': 'Request recommendations from managers and colleagues',
-                    'priority': TaskPriority.MEDIUM,
-                    'time': '20 min',
-                    'impact': 'Medium'
-                },
-                {
-                    'title': '📅 Plan Content Strategy',
-                    'description': 'Create 30-day content and engagement plan',
-                    'priority': TaskPriority.LOW,
-                    'time': '30 min',
-                    'impact': 'Low'
-                },
-                {
-                    'title': '🔍 Optimize Keywords',
-                    'description': 'Ensure consistent keyword usage throughout profile',
-                    'priority': TaskPriority.MEDIUM,
-                    'time': '15 min',
-                    'impact': 'Medium'
-                },
-                {
-                    'title': '📊 Add Measurable Outcomes',
-                    'description': 'Add specific metrics and achievements throughout',
-                    'priority': TaskPriority.HIGH,
-                    'time': '25 min',
-                    'impact': 'High'
-                }
-            ]
-        }
+        self.task_templates = TASK_TEMPLATES
     
     def generate_dynamic_checklist(self, profile_data: Dict[str, Any], quality_scores: Dict[str, Any], 
                                  optimization_report: str, target_industry: str, target_role: str) -> List[ChecklistTask]:
         """Generate personalized checklist based on analysis"""
         
-        checklist_tasks = []
-        
-        # Analyze headline
-        headline_tasks = self._analyze_headline(profile_data.get('headline', ''), quality_scores.get('headline'))
-        checklist_tasks.extend(headline_tasks)
-        
-        # Analyze about section
-        about_tasks = self._analyze_about_section(profile_data.get('about', ''), quality_scores.get('about'))
-        checklist_tasks.extend(about_tasks)
-        
-        # Analyze experience
-        experience_data = profile_data.get('experience', [])
-        # Handle both list of ExperienceItem objects and list of dicts
-        if experience_data and hasattr(experience_data[0], 'description'):
-            # ExperienceItem objects - convert to list format expected by analysis
-            experience_tasks = self._analyze_experience_section(experience_data, quality_scores.get('experience'))
-        else:
-            # Dict objects or empty list
-            experience_tasks = self._analyze_experience_section(experience_data, quality_scores.get('experience'))
-        checklist_tasks.extend(experience_tasks)
-        
-        # Analyze skills
-        skills_tasks = self._analyze_skills_section(profile_data.get('skills', []), quality_scores.get('skills'), target_industry)
-        checklist_tasks.extend(skills_tasks)
-        
-        # Add general optimization tasks
-        general_tasks = self._get_general_optimization_tasks(optimization_report)
-        checklist_tasks.extend(general_tasks)
+        # Analyze each section, then add general optimization tasks
+        checklist_tasks = list(chain(
+            self._analyze_headline(profile_data.get('headline', ''), quality_scores.get('headline')),
+            self._analyze_about_section(profile_data.get('about', ''), quality_scores.get('about')),
+            # Handles both ExperienceItem objects and dicts
+            self._analyze_experience_section(profile_data.get('experience', []), quality_scores.get('experience')),
+            self._analyze_skills_section(profile_data.get('skills', []), quality_scores.get('skills'), target_industry),
+            self._get_general_optimization_tasks(optimization_report)
+        ))
         
         # Sort by priority and impact
-        checklist_tasks.sort(key=lambda x: (x.priority.value, x.impact_level), reverse=True)
+        checklist_tasks.sort(key=lambda x: (_PRIORITY_RANK[x.priority], _IMPACT_RANK[x.impact_level]))
         
         # Assign IDs
         for i, task in enumerate(checklist_tasks):
-            task.id = f"task_{i+1}"
+            task.id = _TASK_IDS[i] if i < len(_TASK_IDS) else f"task_{i+1}"
         
         return checklist_tasks
     
@@ -222,26 +290,12 @@ class DynamicChecklistGenerator:
         tasks = []
         
         if not headline or len(headline) < 60:
-            tasks.append(ChecklistTask(
-                id="", title="📝 Create Compelling Headline",
-                description="Write a headline that's 60-120 characters and includes your value proposition",
-                priority=TaskPriority.HIGH,
-                estimated_time="10 min",
-                impact_level="High",
-                section="Headline"
-            ))
+            tasks.append(replace(TASK_CATALOG['headline_create']))
         
         if headline_score and headline_score.score < 80:
             # Add specific tasks based on score feedback
             if "value proposition" in str(headline_score.feedback):
-                tasks.append(ChecklistTask(
-                    id="", title="🎯 Add Value Proposition",
-                    description="Include what value you bring to potential employers",
-                    priority=TaskPriority.HIGH,
-                    estimated_time="5 min",
-                    impact_level="High",
-                    section="Headline"
-                ))
+                tasks.append(replace(TASK_CATALOG['headline_value_proposition']))
         
         return tasks
     
@@ -252,35 +306,16 @@ class DynamicChecklistGenerator:
         word_count = len(about.split()) if about else 0
         
         if word_count < 300:
-            tasks.append(ChecklistTask(
-                id="", title="📄 Expand About Section",
-                description=f"Expand from {word_count} to 300-500 words with more detail",
-                priority=TaskPriority.HIGH,
-                estimated_time="20 min",
-                impact_level="High",
-                section="About"
-            ))
+            tasks.append(replace(TASK_CATALOG['about_expand'], description=f"Expand from {word_count} to 300-500 words with more detail"))
         
         if about_score and about_score.score < 70:
-            if "storytelling" in str(about_score.feedback):
-                tasks.append(ChecklistTask(
-                    id="", title="📖 Add Career Story",
-                    description="Add your professional journey and passion narrative",
-                    priority=TaskPriority.MEDIUM,
-                    estimated_time="15 min",
-                    impact_level="Medium",
-                    section="About"
-                ))
+            feedback_text = str(about_score.feedback)
+            
+            if "storytelling" in feedback_text:
+                tasks.append(replace(TASK_CATALOG['about_story']))
             
-            if "quantifiable" in str(about_score.feedback):
-                tasks.append(ChecklistTask(
-                    id="", title="📊 Add Measurable Achievements",
-                    description="Include specific numbers and achievements in your story",
-                    priority=TaskPriority.HIGH,
-                    estimated_time="10 min",
-                    impact_level="High",
-                    section="About"
-                ))
+            if "quantifiable" in feedback_text:
+                tasks.append(replace(TASK_CATALOG['about_achievements']))
         
         return tasks
     
@@ -289,14 +324,7 @@ class DynamicChecklistGenerator:
         tasks = []
         
         if not experiences:
-            tasks.append(ChecklistTask(
-                id="", title="💼 Add Experience Entries",
-                description="Add your work experience with detailed descriptions",
-                priority=TaskPriority.HIGH,
-                estimated_time="30 min",
-                impact_level="High",
-                section="Experience"
-            ))
+            tasks.append(replace(TASK_CATALOG['experience_add']))
             return tasks
         
         # Check for missing metrics in experience descriptions
@@ -309,26 +337,12 @@ class DynamicChecklistGenerator:
                 description = exp.get('description', '')
                 title = exp.get('title', 'Experience')
             
-            if not any(indicator in description.lower() for indicator in ['%', '$', 'number', 'increased', 'decreased']):
-                tasks.append(ChecklistTask(
-                    id="", title=f"📈 Add Metrics to {title}",
-                    description="Add specific numbers and results to this experience",
-                    priority=TaskPriority.HIGH,
-                    estimated_time="10 min",
-                    impact_level="High",
-                    section="Experience"
-                ))
+            if not _METRIC_INDICATOR_RE.search(description):
+                tasks.append(replace(TASK_CATALOG['experience_metrics'], title=f"📈 Add Metrics to {title}"))
         
         if experience_score and experience_score.score < 70:
             if "action verbs" in str(experience_score.feedback):
-                tasks.append(ChecklistTask(
-                    id="", title="⚡ Add Action Verbs",
-                    description="Start bullet points with strong action verbs",
-                    priority=TaskPriority.HIGH,
-                    estimated_time="15 min",
-                    impact_level="High",
-                    section="Experience"
-                ))
+                tasks.append(replace(TASK_CATALOG['experience_action_verbs']))
         
         return tasks
     
@@ -337,25 +351,11 @@ class DynamicChecklistGenerator:
         tasks = []
         
         if len(skills) < 10:
-            tasks.append(ChecklistTask(
-                id="", title="🎯 Add More Skills",
-                description=f"Add {10 - len(skills)} more relevant skills to reach optimal count",
-                priority=TaskPriority.HIGH,
-                estimated_time="10 min",
-                impact_level="High",
-                section="Skills"
-            ))
+            tasks.append(replace(TASK_CATALOG['skills_add'], description=f"Add {10 - len(skills)} more relevant skills to reach optimal count"))
         
         if skills_score and skills_score.score < 70:
             if "industry-relevant" in str(skills_score.feedback):
-                tasks.append(ChecklistTask(
-                    id="", title="🔍 Add Industry-Specific Skills",
-                    description=f"Add more {target_industry} specific skills",
-                    priority=TaskPriority.HIGH,
-                    estimated_time="15 min",
-                    impact_level="High",
-                    section="Skills"
-                ))
+                tasks.append(replace(TASK_CATALOG['skills_industry'], description=f"Add more {target_industry} specific skills"))
         
         return tasks
     
@@ -365,51 +365,33 @@ class DynamicChecklistGenerator:
         
         # Always include these general tasks
         tasks.extend([
-            ChecklistTask(
-                id="", title="📱 Get Recommendations",
-                description="Request recommendations from managers and colleagues",
-                priority=TaskPriority.MEDIUM,
-                estimated_time="20 min",
-                impact_level="Medium",
-                section="General"
-            ),
-            ChecklistTask(
-                id="", title="📅 Plan Content Strategy",
-                description="Create 30-day content and engagement plan",
-                priority=TaskPriority.LOW,
-                estimated_time="30 min",
-                impact_level="Low",
-                section="General"
-            )
+            replace(TASK_CATALOG['general_recommendations']),
+            replace(TASK_CATALOG['general_content_strategy'])
         ])
         
         return tasks
     
+    def group_tasks_by_priority(self, tasks: List[ChecklistTask]) -> Dict[str, List[ChecklistTask]]:
+        """Group tasks into high/medium/low buckets in a single pass, preserving order"""
+        buckets = {priority.value: [] for priority in TaskPriority}
+        for task in tasks:
+            buckets[task.priority.value].append(task)
+        return buckets
+    
     def estimate_completion_time(self, tasks: List[ChecklistTask]) -> Dict[str, Any]:
         """Estimate total completion time and breakdown"""
         total_minutes = 0
-        priority_breakdown = {
-            TaskPriority.HIGH: 0,
-            TaskPriority.MEDIUM: 0,
-            TaskPriority.LOW: 0
-        }
+        priority_breakdown = {priority.value: 0 for priority in TaskPriority}
         
         for task in tasks:
-            # Parse time estimate (e.g., "15 min" -> 15)
-            time_match = re.search(r'(\d+)', task.estimated_time)
-            if time_match:
-                minutes = int(time_match.group(1))
-                total_minutes += minutes
-                priority_breakdown[task.priority] += minutes
+            minutes = task.estimated_minutes
+            total_minutes += minutes
+            priority_breakdown[task.priority.value] += minutes
         
         return {
             'total_minutes': total_minutes,
             'total_hours': round(total_minutes / 60, 1),
-            'priority_breakdown': {
-                'high': priority_breakdown[TaskPriority.HIGH],
-                'medium': priority_breakdown[TaskPriority.MEDIUM],
-                'low': priority_breakdown[TaskPriority.LOW]
-            },
+            'priority_breakdown': priority_breakdown,
             'formatted_time': self._format_time(total_minutes)
         }
     
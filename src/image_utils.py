@@ -4,40 +4,71 @@ Image processing utilities for LinkedIn Profile Optimization Agent
 
 import base64
 import io
-from typing import Tuple
-from PIL import Image
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional, Tuple
 
+# Pillow is imported inside the functions that use it, so importing this
+# module (e.g. via the vision engine) doesn't load it until an image is handled
+if TYPE_CHECKING:
+    from PIL import Image
 
-def resize_image(image_file, max_width: int = 1024) -> Image.Image:
+# Upper bound on worker threads for multi-image uploads
+MAX_IMAGE_WORKERS = 4
+
+
+def crop_uniform_border(image: "Image.Image") -> "Image.Image":
+    """
+    Crop away a uniform border (e.g. blank page margins) around a screenshot.
+    
+    Args:
+        image: RGB PIL Image object
+        
+    Returns:
+        Cropped PIL Image object, or the original if there is no border
+    """
+    from PIL import Image, ImageChops
+    
+    background = Image.new(image.mode, image.size, image.getpixel((0, 0)))
+    bbox = ImageChops.difference(image, background).getbbox()
+    if bbox and bbox != (0, 0, image.width, image.height):
+        return image.crop(bbox)
+    return image
+
+
+def resize_image(image_file, max_width: int = 1024, max_height: Optional[int] = None) -> "Image.Image":
     """
     Resize an image to the specified maximum width while maintaining aspect ratio.
     
     Args:
         image_file: Uploaded file object from Streamlit
         max_width: Maximum width for the resized image
+        max_height: Optional maximum height for the resized image
         
     Returns:
         PIL Image object
     """
+    from PIL import Image
+    
     try:
         # Open the image
         image = Image.open(image_file)
         
-        # Convert to RGB if necessary (for PNG with alpha channel)
-        if image.mode in ('RGBA', 'LA', 'P'):
+        # Convert to RGB if necessary, flattening onto white only when the
+        # alpha channel is actually used (PNG screenshots are usually opaque)
+        if image.mode == 'P':
+            image = image.convert('RGBA' if 'transparency' in image.info else 'RGB')
+        if image.mode == 'RGBA' and image.getchannel('A').getextrema()[0] < 255:
             background = Image.new('RGB', image.size, (255, 255, 255))
-            if image.mode == 'P':
-                image = image.convert('RGBA')
-            background.paste(image, mask=image.split()[-1] if image.mode == 'RGBA' else None)
+            background.paste(image, mask=image.getchannel('A'))
             image = background
+        elif image.mode != 'RGB':
+            image = image.convert('RGB')
+        
+        # Drop blank margins so they don't cost vision tokens
+        image = crop_uniform_border(image)
         
-        # Calculate new dimensions
-        width, height = image.size
-        if width > max_width:
-            ratio = max_width / width
-            new_width = max_width
-            new_height = int(height * ratio)
-            image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        # Downscale in place, preserving aspect ratio
+        image.thumbnail((max_width, max_height or image.height), Image.Resampling.LANCZOS)
         
         return image
         
@@ -45,7 +76,7 @@ def resize_image(image_file, max_width: int = 1024) -> Image.Image:
         raise ValueError(f"Error processing image: {str(e)}")
 
 
-def encode_image_base64(image: Image.Image) -> str:
+def encode_image_base64(image: "Image.Image") -> str:
     """
     Encode a PIL Image as a base64 string.
     
@@ -59,40 +90,45 @@ def encode_image_base64(image: Image.Image) -> str:
         # Convert image to bytes
         buffer = io.BytesIO()
         image.save(buffer, format='JPEG', quality=85)
-        image_bytes = buffer.getvalue()
         
-        # Encode to base64
-        base64_string = base64.b64encode(image_bytes).decode('utf-8')
-        return base64_string
+        # Encode to base64 straight from the buffer, without copying the JPEG bytes
+        return base64.b64encode(buffer.getbuffer()).decode('ascii')
         
     except Exception as e:
         raise ValueError(f"Error encoding image to base64: {str(e)}")
 
 
-def process_uploaded_images(uploaded_files, max_width: int = 1024) -> list:
+def process_uploaded_images(uploaded_files, max_width: int = 1024, max_height: Optional[int] = None) -> list:
     """
     Process multiple uploaded image files and return base64 encoded strings.
     
     Args:
         uploaded_files: List of uploaded file objects from Streamlit
         max_width: Maximum width for resized images
+        max_height: Optional maximum height for resized images
         
     Returns:
         List of base64 encoded image strings
     """
-    base64_images = []
-    
-    for uploaded_file in uploaded_files:
+    def _process(uploaded_file):
         try:
-            # Resize and encode each image
-            resized_image = resize_image(uploaded_file, max_width)
-            base64_image = encode_image_base64(resized_image)
-            base64_images.append(base64_image)
+            return encode_image_base64(resize_image(uploaded_file, max_width, max_height))
         except Exception as e:
             print(f"Warning: Failed to process {uploaded_file.name}: {str(e)}")
-            continue
+            return None
+    
+    uploaded_files = list(uploaded_files)
+    if not uploaded_files:
+        return []
     
-    return base64_images
+    # Decode, resize and JPEG encoding release the GIL, so process uploads concurrently
+    if len(uploaded_files) == 1:
+        results = [_process(uploaded_files[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=min(MAX_IMAGE_WORKERS, len(uploaded_files))) as executor:
+            results = list(executor.map(_process, uploaded_files))
+    
+    return [result for result in results if result]
 
 
 def get_image_info(image_file) -> Tuple[str, int, int]:
@@ -105,6 +141,8 @@ def get_image_info(image_file) -> Tuple[str, int, int]:
     Returns:
         Tuple of (format, width, height)
     """
+    from PIL import Image
+    
     try:
         image = Image.open(image_file)
         return image.format, image.width, image.height
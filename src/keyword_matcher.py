@@ -0,0 +1,37 @@
+"""
+Multi-keyword substring matching shared by the content scorer and validator
+"""
+
+from typing import List
+
+# Optional Aho-Corasick automaton for single-pass multi-keyword matching
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+class KeywordMatcher:
+    """Counts how many distinct keywords occur as substrings of a text"""
+    
+    def __init__(self, keywords: List[str]):
+        self.keywords = tuple(dict.fromkeys(keywords))
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE and self.keywords:
+            self._automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                self._automaton.add_word(keyword, keyword)
+            self._automaton.make_automaton()
+    
+    def find(self, text: str) -> set:
+        """Distinct keywords found in text"""
+        if self._automaton is not None:
+            return {keyword for _, keyword in self._automaton.iter(text)}
+        return {keyword for keyword in self.keywords if keyword in text}
+    
+    def count(self, text: str) -> int:
+        """Number of distinct keywords found in text"""
+        if self._automaton is not None:
+            return len(self.find(text))
+        return sum(map(text.__contains__, self.keywords))
@@ -5,7 +5,10 @@ MLOps module for Llama 3 fine-tuning via Together AI
 import os
 import time
 import json
-from typing import Dict, Any, Optional, Tuple
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 
 # Optional together library
 try:
@@ -14,9 +17,22 @@ try:
 except ImportError:
     TOGETHER_AVAILABLE = False
 
+# Optional orjson for faster dataset parsing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
 from .config import Config
 from .training_logger import training_logger
 
+# Lower bound on the bytes one logged JSONL example takes: the training record
+# skeleton with every field empty, compact orjson output and a whole-second timestamp
+MIN_BYTES_PER_EXAMPLE = 228
+
 
 class MLOpsManager:
     """Manager for ML operations including fine-tuning"""
@@ -30,6 +46,9 @@ class MLOpsManager:
             raise ValueError("Together AI API key is required for MLOps operations")
         
         together.api_key = Config.TOGETHER_API_KEY
+        
+        # Final (status, model_id) of jobs that completed or failed; these never change
+        self._terminal_status: Dict[str, Tuple[str, Optional[str]]] = {}
     
     def start_finetune_job(
         self,
@@ -86,6 +105,13 @@ class MLOpsManager:
             job_id = job_response['id']
             print(f"Fine-tuning job started with ID: {job_id}")
             
+            # Poll once right away; jobs that fail validation are terminal already
+            # and get cached, so a following wait_for_completion returns immediately
+            try:
+                self.check_finetune_status(job_id)
+            except RuntimeError as e:
+                print(f"Error checking initial status: {e}")
+            
             return job_id
             
         except Exception as e:
@@ -101,6 +127,9 @@ class MLOpsManager:
         Returns:
             Tuple of (status, model_id) where model_id is None if not completed
         """
+        if job_id in self._terminal_status:
+            return self._terminal_status[job_id]
+        
         try:
             # Get job status
             job_response = together.Finetune.retrieve(job_id)
@@ -127,24 +156,71 @@ class MLOpsManager:
             else:
                 print(f"Job {job_id} status: {status}")
             
+            if status in ('completed', 'failed'):
+                self._terminal_status[job_id] = (status, model_id)
+            
             return status, model_id
             
         except Exception as e:
             raise RuntimeError(f"Failed to check job status: {str(e)}")
     
-    def wait_for_completion(self, job_id: str, check_interval: int = 60, timeout: int = 3600) -> Tuple[str, Optional[str]]:
+    def check_many(
+        self,
+        job_ids: List[str],
+        max_concurrency: int = 8
+    ) -> Dict[str, Tuple[str, Optional[str]]]:
+        """
+        Check the status of several fine-tuning jobs concurrently.
+        
+        Args:
+            job_ids: Job IDs to check
+            max_concurrency: Maximum number of in-flight status requests
+            
+        Returns:
+            Dictionary mapping each job ID to its (status, model_id); jobs whose
+            status could not be retrieved map to ("error", None)
+        """
+        results = {job_id: self._terminal_status[job_id] for job_id in job_ids if job_id in self._terminal_status}
+        pending = [job_id for job_id in dict.fromkeys(job_ids) if job_id not in results]
+        
+        if pending:
+            # Status requests are I/O bound, so up to max_concurrency run at once
+            with ThreadPoolExecutor(max_workers=min(max_concurrency, len(pending))) as executor:
+                results.update(zip(pending, executor.map(self._check_status_or_error, pending)))
+        
+        return results
+    
+    def _check_status_or_error(self, job_id: str) -> Tuple[str, Optional[str]]:
+        """Check one job for check_many, so a failed lookup does not discard the other jobs"""
+        try:
+            return self.check_finetune_status(job_id)
+        except Exception as e:
+            print(f"Error checking status of job {job_id}: {e}")
+            return "error", None
+    
+    def wait_for_completion(
+        self,
+        job_id: str,
+        initial_interval: float = 10,
+        max_interval: float = 300,
+        multiplier: float = 1.5,
+        timeout: int = 3600
+    ) -> Tuple[str, Optional[str]]:
         """
-        Wait for a fine-tuning job to complete.
+        Wait for a fine-tuning job to complete, backing off between status checks.
         
         Args:
             job_id: Job ID to wait for
-            check_interval: Seconds between status checks
+            initial_interval: Seconds before the second status check
+            max_interval: Upper bound on seconds between status checks
+            multiplier: Factor applied to the interval after each check
             timeout: Maximum time to wait in seconds
             
         Returns:
             Tuple of (final_status, model_id)
         """
         start_time = time.time()
+        interval = initial_interval
         
         while time.time() - start_time < timeout:
             try:
@@ -153,12 +229,17 @@ class MLOpsManager:
                 if status in ['completed', 'failed']:
                     return status, model_id
                 
-                print(f"Waiting {check_interval} seconds for next check...")
-                time.sleep(check_interval)
-                
             except Exception as e:
                 print(f"Error checking status: {e}")
-                time.sleep(check_interval)
+            
+            # Never sleep past the deadline
+            remaining = timeout - (time.time() - start_time)
+            if remaining <= 0:
+                break
+            wait = min(interval, remaining)
+            print(f"Waiting {wait:.0f} seconds for next check...")
+            time.sleep(wait)
+            interval = min(max_interval, interval * multiplier)
         
         raise TimeoutError(f"Job {job_id} did not complete within {timeout} seconds")
     
@@ -220,22 +301,17 @@ class MLOpsManager:
         try:
             dataset_path = dataset_path or Config.TRAINING_DATASET_PATH
             
-            # Count examples and estimate tokens
-            examples = []
+            # Count examples and estimate tokens in one streaming pass
+            num_examples = 0
+            total_chars = 0
             if os.path.exists(dataset_path):
-                with open(dataset_path, 'r') as f:
+                # Both parsers accept raw UTF-8 bytes, so skip text decoding
+                with open(dataset_path, 'rb') as f:
                     for line in f:
                         if line.strip():
-                            examples.append(json.loads(line))
-            
-            num_examples = len(examples)
-            
-            # Estimate tokens (rough calculation)
-            total_chars = 0
-            for example in examples:
-                input_text = json.dumps(example.get('input', {}))
-                output_text = example.get('output', '')
-                total_chars += len(input_text) + len(output_text)
+                            example = _json_loads(line)
+                            num_examples += 1
+                            total_chars += len(json.dumps(example.get('input', {}))) + len(example.get('output', ''))
             
             estimated_tokens = total_chars // 4  # Rough estimate: 1 token ≈ 4 chars
             
@@ -273,6 +349,13 @@ class MLOpsManager:
             True if preparation was successful, False otherwise
         """
         try:
+            # Skip parsing the log when it is too small to hold enough examples
+            dataset_path = training_logger.dataset_path
+            if dataset_path and os.path.exists(dataset_path):
+                if os.path.getsize(dataset_path) < MIN_BYTES_PER_EXAMPLE * min_examples:
+                    print(f"Insufficient examples: dataset is smaller than {min_examples} examples")
+                    return False
+            
             # Get dataset stats
             stats = training_logger.get_dataset_stats()
             
@@ -315,19 +398,37 @@ class MLOpsManager:
                     env_lines = f.readlines()
             
             # Update or add CUSTOM_LLAMA3_MODEL_ID
+            model_line = f"CUSTOM_LLAMA3_MODEL_ID={model_id}\n"
             model_line_found = False
             for i, line in enumerate(env_lines):
                 if line.startswith("CUSTOM_LLAMA3_MODEL_ID="):
-                    env_lines[i] = f"CUSTOM_LLAMA3_MODEL_ID={model_id}\n"
+                    if line.rstrip('\r\n') == model_line[:-1]:
+                        print(f"{env_file} already uses model ID: {model_id}")
+                        return True
+                    env_lines[i] = model_line
                     model_line_found = True
                     break
             
             if not model_line_found:
-                env_lines.append(f"CUSTOM_LLAMA3_MODEL_ID={model_id}\n")
+                env_lines.append(model_line)
             
-            # Write back to file
-            with open(env_file, 'w') as f:
-                f.writelines(env_lines)
+            # Write to a temp file and swap it in so a crash never leaves a partial .env;
+            # replace the symlink target rather than the link, keeping its permissions
+            target_path = os.path.realpath(env_file)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target_path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    f.writelines(env_lines)
+                if os.path.exists(target_path):
+                    shutil.copymode(target_path, tmp_path)
+                else:
+                    umask = os.umask(0)
+                    os.umask(umask)
+                    os.chmod(tmp_path, 0o666 & ~umask)
+                os.replace(tmp_path, target_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
             
             print(f"Updated {env_file} with new model ID: {model_id}")
             return True
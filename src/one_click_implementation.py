@@ -7,6 +7,29 @@ from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 from io import BytesIO
 
+# Report parsing and formatting patterns, compiled once
+_NUMBERED_RE = re.compile(r'^\d+\.')
+_HEADLINE_MARKER_RE = re.compile(r'^\d+\.\s*|•\s*')
+_LIST_MARKER_RE = re.compile(r'^\d+\.\s*|•\s*|-\s*')
+_SECTION_BREAK_RE = re.compile(r'\n[A-Z]+ [A-Z]+')
+_LEADING_BULLET_RE = re.compile(r'^\s*[•\-\*]\s*')
+_WHITESPACE_RE = re.compile(r'\s+')
+_SENTENCE_START_RE = re.compile(r'([.!?]\s+)([a-z])')
+
+# Major report sections, in the order the optimization report presents them
+SECTION_HEADERS = (
+    "OVERALL PROFILE REVIEW", "HEADLINE OPTIMIZATION", "ABOUT SECTION COMPLETE REWRITE",
+    "EXPERIENCE SECTION ENHANCEMENT", "SKILLS STRATEGY", "RECOMMENDATIONS STRATEGY",
+    "CONTENT & ENGAGEMENT PLAN"
+)
+
+# LinkedIn (min, max) character limits per section
+LINKEDIN_LIMITS = {
+    'headline': (60, 120),
+    'about': (300, 500),
+    'experience': (50, 300)
+}
+
 @dataclass
 class ContentSection:
     """Content section for implementation"""
@@ -20,11 +43,7 @@ class OneClickImplementation:
     """Smart implementation system with formatting and validation"""
     
     def __init__(self):
-        self.linkedin_limits = {
-            'headline': {'min': 60, 'max': 120},
-            'about': {'min': 300, 'max': 500},
-            'experience': {'min': 50, 'max': 300}
-        }
+        self.linkedin_limits = LINKEDIN_LIMITS
         
         self.formatting_rules = {
             'remove_extra_whitespace': True,
@@ -37,9 +56,10 @@ class OneClickImplementation:
         """Extract and format content sections from optimization report"""
         
         sections = {}
+        report_sections = self._split_report(optimization_report)
         
         # Extract headline options
-        headline_content = self._extract_headline_content(optimization_report)
+        headline_content = self._extract_headline_content(report_sections)
         if headline_content:
             sections['headline'] = ContentSection(
                 title="Headline Options",
@@ -50,7 +70,7 @@ class OneClickImplementation:
             )
         
         # Extract about section
-        about_content = self._extract_about_content(optimization_report)
+        about_content = self._extract_about_content(report_sections)
         if about_content:
             sections['about'] = ContentSection(
                 title="About Section",
@@ -61,7 +81,7 @@ class OneClickImplementation:
             )
         
         # Extract experience content
-        experience_content = self._extract_experience_content(optimization_report)
+        experience_content = self._extract_experience_content(report_sections)
         if experience_content:
             sections['experience'] = ContentSection(
                 title="Experience Section",
@@ -72,7 +92,7 @@ class OneClickImplementation:
             )
         
         # Extract skills content
-        skills_content = self._extract_skills_content(optimization_report)
+        skills_content = self._extract_skills_content(report_sections)
         if skills_content:
             sections['skills'] = ContentSection(
                 title="Skills Section",
@@ -84,28 +104,27 @@ class OneClickImplementation:
         
         return sections
     
-    def _extract_headline_content(self, report: str) -> str:
+    def _extract_headline_content(self, report_sections: Dict[str, str]) -> str:
         """Extract headline options from report"""
-        headline_section = self._find_section(report, "HEADLINE OPTIMIZATION")
+        headline_section = report_sections.get("HEADLINE OPTIMIZATION", "")
         if not headline_section:
             return ""
         
         # Look for recommended headlines
         headlines = []
-        lines = headline_section.split('\n')
         
-        for line in lines:
+        for line in map(str.strip, headline_section.split('\n')):
             # Look for numbered or bulleted headlines
-            if re.match(r'^\d+\.', line.strip()) or line.strip().startswith('•'):
-                clean_line = re.sub(r'^\d+\.\s*|•\s*', '', line.strip())
+            if _NUMBERED_RE.match(line) or line.startswith('•'):
+                clean_line = _HEADLINE_MARKER_RE.sub('', line)
                 if clean_line and len(clean_line) > 20:  # Reasonable headline length
                     headlines.append(clean_line)
         
         return '\n'.join(headlines) if headlines else ""
     
-    def _extract_about_content(self, report: str) -> str:
+    def _extract_about_content(self, report_sections: Dict[str, str]) -> str:
         """Extract complete about section rewrite"""
-        about_section = self._find_section(report, "ABOUT SECTION COMPLETE REWRITE")
+        about_section = report_sections.get("ABOUT SECTION COMPLETE REWRITE", "")
         if not about_section:
             return ""
         
@@ -115,14 +134,14 @@ class OneClickImplementation:
             if len(parts) > 1:
                 content = parts[1].strip()
                 # Remove any section headers that follow
-                content = re.split(r'\n[A-Z]+ [A-Z]+', content)[0].strip()
+                content = _SECTION_BREAK_RE.split(content, 1)[0].strip()
                 return content
         
         return about_section.strip()
     
-    def _extract_experience_content(self, report: str) -> str:
+    def _extract_experience_content(self, report_sections: Dict[str, str]) -> str:
         """Extract enhanced experience content"""
-        experience_section = self._find_section(report, "EXPERIENCE SECTION ENHANCEMENT")
+        experience_section = report_sections.get("EXPERIENCE SECTION ENHANCEMENT", "")
         if not experience_section:
             return ""
         
@@ -130,75 +149,57 @@ class OneClickImplementation:
         content = experience_section.strip()
         
         # Remove section headers and keep only content
-        lines = content.split('\n')
-        content_lines = []
-        
-        for line in lines:
-            line = line.strip()
-            # Skip headers and empty lines
-            if not line or line.isupper() or line.startswith('CURRENT') or line.startswith('RECOMMENDED'):
-                continue
-            content_lines.append(line)
-        
-        return '\n'.join(content_lines)
+        return '\n'.join(
+            line for line in map(str.strip, content.split('\n'))
+            if line and not line.isupper() and not line.startswith(('CURRENT', 'RECOMMENDED'))
+        )
     
-    def _extract_skills_content(self, report: str) -> str:
+    def _extract_skills_content(self, report_sections: Dict[str, str]) -> str:
         """Extract skills strategy content"""
-        skills_section = self._find_section(report, "SKILLS STRATEGY")
+        skills_section = report_sections.get("SKILLS STRATEGY", "")
         if not skills_section:
             return ""
         
         # Extract skills list
         skills = []
-        lines = skills_section.split('\n')
         
-        for line in lines:
+        for line in map(str.strip, skills_section.split('\n')):
             # Look for skills in list format
-            if re.match(r'^\d+\.', line.strip()) or line.strip().startswith('•') or line.strip().startswith('-'):
-                clean_line = re.sub(r'^\d+\.\s*|•\s*|-\s*', '', line.strip())
+            if _NUMBERED_RE.match(line) or line.startswith(('•', '-')):
+                clean_line = _LIST_MARKER_RE.sub('', line)
                 if clean_line and len(clean_line) > 2:
                     skills.append(clean_line)
         
         return '\n'.join(skills) if skills else ""
     
-    def _find_section(self, report: str, section_name: str) -> str:
-        """Find and extract a specific section from the report"""
-        start_pos = report.find(section_name)
-        if start_pos == -1:
-            return ""
-        
-        # Find next major section
-        section_headers = [
-            "OVERALL PROFILE REVIEW", "HEADLINE OPTIMIZATION", "ABOUT SECTION COMPLETE REWRITE",
-            "EXPERIENCE SECTION ENHANCEMENT", "SKILLS STRATEGY", "RECOMMENDATIONS STRATEGY",
-            "CONTENT & ENGAGEMENT PLAN"
-        ]
-        
-        end_pos = len(report)
-        current_index = section_headers.index(section_name)
+    def _split_report(self, report: str) -> Dict[str, str]:
+        """Split the report into its major sections, locating each header once"""
+        positions = [report.find(header) for header in SECTION_HEADERS]
+        report_sections = {}
         
-        for next_section in section_headers[current_index + 1:]:
-            next_pos = report.find(next_section)
-            if next_pos != -1 and next_pos > start_pos:
-                end_pos = next_pos
-                break
+        for index, start_pos in enumerate(positions):
+            if start_pos == -1:
+                continue
+            
+            # A section ends at the first later header found after it
+            end_pos = len(report)
+            for next_pos in positions[index + 1:]:
+                if next_pos != -1 and next_pos > start_pos:
+                    end_pos = next_pos
+                    break
+            
+            report_sections[SECTION_HEADERS[index]] = report[start_pos:end_pos]
         
-        return report[start_pos:end_pos]
+        return report_sections
     
     def _format_headline_content(self, content: str) -> str:
         """Format headline content for LinkedIn"""
         # Clean up and format headlines
-        headlines = content.split('\n')
-        formatted_headlines = []
-        
-        for headline in headlines:
-            headline = headline.strip()
-            if headline:
-                # Ensure proper capitalization
-                headline = self._ensure_proper_capitalization(headline)
-                # Remove extra whitespace
-                headline = re.sub(r'\s+', ' ', headline)
-                formatted_headlines.append(headline)
+        # Ensure proper capitalization and remove extra whitespace
+        formatted_headlines = [
+            _WHITESPACE_RE.sub(' ', self._ensure_proper_capitalization(headline))
+            for headline in map(str.strip, content.split('\n')) if headline
+        ]
         
         return '\n\n'.join(formatted_headlines)
     
@@ -212,9 +213,9 @@ class OneClickImplementation:
             paragraph = paragraph.strip()
             if paragraph:
                 # Remove bullet points that might be in the middle
-                paragraph = re.sub(r'^\s*[•\-\*]\s*', '', paragraph)
+                paragraph = _LEADING_BULLET_RE.sub('', paragraph)
                 # Ensure proper spacing
-                paragraph = re.sub(r'\s+', ' ', paragraph)
+                paragraph = _WHITESPACE_RE.sub(' ', paragraph)
                 # Proper capitalization
                 paragraph = self._ensure_proper_capitalization(paragraph)
                 formatted_paragraphs.append(paragraph)
@@ -224,18 +225,16 @@ class OneClickImplementation:
     def _format_experience_content(self, content: str) -> str:
         """Format experience content for LinkedIn"""
         # Clean up bullet points and formatting
-        lines = content.split('\n')
         formatted_lines = []
         
-        for line in lines:
-            line = line.strip()
+        for line in map(str.strip, content.split('\n')):
             if not line:
                 continue
             
             # Format bullet points
-            if re.match(r'^\d+\.', line) or line.startswith('•') or line.startswith('-'):
+            if _NUMBERED_RE.match(line) or line.startswith(('•', '-')):
                 # Ensure consistent bullet format
-                clean_line = re.sub(r'^\d+\.\s*|•\s*|-\s*', '• ', line)
+                clean_line = _LIST_MARKER_RE.sub('• ', line)
                 # Ensure proper capitalization
                 clean_line = self._ensure_proper_capitalization(clean_line[2:])
                 formatted_lines.append('• ' + clean_line)
@@ -249,14 +248,12 @@ class OneClickImplementation:
     def _format_skills_content(self, content: str) -> str:
         """Format skills content for LinkedIn"""
         # Clean up skills list
-        skills = content.split('\n')
         formatted_skills = []
         
-        for skill in skills:
-            skill = skill.strip()
+        for skill in map(str.strip, content.split('\n')):
             if skill:
                 # Remove any numbering or bullets
-                clean_skill = re.sub(r'^\d+\.\s*|•\s*|-\s*', '', skill)
+                clean_skill = _LIST_MARKER_RE.sub('', skill)
                 clean_skill = clean_skill.strip()
                 if clean_skill:
                     formatted_skills.append(clean_skill)
@@ -268,8 +265,9 @@ class OneClickImplementation:
         if not text:
             return text
         
-        # Capitalize first letter of sentences
-        text = re.sub(r'([.!?]\s+)([a-z])', lambda m: m.group(1) + m.group(2).upper(), text)
+        # Capitalize first letter of sentences; fragments without punctuation have none
+        if '.' in text or '!' in text or '?' in text:
+            text = _SENTENCE_START_RE.sub(lambda m: m.group(1) + m.group(2).upper(), text)
         
         # Capitalize first letter if it's lowercase
         if text and text[0].islower():
@@ -279,23 +277,24 @@ class OneClickImplementation:
     
     def validate_content_length(self, section: str, content: str) -> Dict[str, Any]:
         """Validate content against LinkedIn limits"""
-        limits = self.linkedin_limits.get(section, {})
+        limits = self.linkedin_limits.get(section)
         
-        if not limits:
+        if limits is None:
             return {'valid': True, 'message': 'No limits defined for this section'}
         
+        min_chars, max_chars = limits
         char_count = len(content)
         
-        if char_count < limits['min']:
+        if char_count < min_chars:
             return {
                 'valid': False,
-                'message': f'Too short - minimum {limits["min"]} characters (currently {char_count})',
+                'message': f'Too short - minimum {min_chars} characters (currently {char_count})',
                 'type': 'too_short'
             }
-        elif char_count > limits['max']:
+        elif char_count > max_chars:
             return {
                 'valid': False,
-                'message': f'Too long - maximum {limits["max"]} characters (currently {char_count})',
+                'message': f'Too long - maximum {max_chars} characters (currently {char_count})',
                 'type': 'too_long'
             }
         else:
@@ -324,10 +323,13 @@ class OneClickImplementation:
             )
         
         # Calculate totals
+        content_parts = []
         for section_data in sections.values():
-            package['total_content'] += section_data.formatted_content + '\n\n'
+            content_parts.append(section_data.formatted_content)
+            content_parts.append('\n\n')
             package['word_count'] += section_data.word_count
             package['character_count'] += section_data.character_count
+        package['total_content'] = ''.join(content_parts)
         
         return package
     
@@ -345,16 +347,18 @@ class OneClickImplementation:
     
     def create_batch_copy_text(self, sections: Dict[str, ContentSection]) -> str:
         """Create batch copy text for all sections"""
-        batch_text = "LINKEDIN PROFILE OPTIMIZATION - READY TO IMPLEMENT\n"
-        batch_text += "=" * 60 + "\n\n"
+        parts = ["LINKEDIN PROFILE OPTIMIZATION - READY TO IMPLEMENT\n", "=" * 60 + "\n\n"]
         
         order = ['headline', 'about', 'experience', 'skills']
         
         for section_name in order:
             if section_name in sections:
                 section = sections[section_name]
-                batch_text += f"=== {section.title.upper()} ===\n\n"
-                batch_text += section.formatted_content + "\n\n"
-                batch_text += "-" * 40 + "\n\n"
-        
-        return batch_text
+                parts.extend((
+                    f"=== {section.title.upper()} ===\n\n",
+                    section.formatted_content,
+                    "\n\n",
+                    "-" * 40 + "\n\n"
+                ))
+        
+        return ''.join(parts)
@@ -3,7 +3,8 @@ Enhanced strategy engine for LinkedIn profile optimization
 """
 
 import json
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Dict, List, Any, Iterator, Optional
 from openai import OpenAI
 
 # Optional together library
@@ -13,6 +14,13 @@ try:
 except ImportError:
     TOGETHER_AVAILABLE = False
 
+# Optional tiktoken library for accurate token counts
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
 from .config import Config
 from .prompt_templates import get_system_prompt, format_profile_for_prompt, format_followup_content
 from .prompt_formatter import PromptFormatter
@@ -20,6 +28,19 @@ from .vision_engine import LinkedInProfile
 from .content_validator import content_validator
 
 
+@lru_cache(maxsize=1)
+def _get_token_encoder():
+    """Load the tokenizer once per process"""
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def count_tokens(text: str) -> int:
+    """Count tokens with tiktoken, falling back to ~4 characters per token"""
+    if TIKTOKEN_AVAILABLE:
+        return len(_get_token_encoder().encode(text))
+    return len(text) // 4
+
+
 class StrategyEngine:
     """Enhanced engine for generating LinkedIn profile optimization strategies"""
     
@@ -37,7 +58,7 @@ class StrategyEngine:
             together.api_key = Config.TOGETHER_API_KEY
             self.together_client = together
     
-    def _call_openai_model(self, messages: list, model_id: str) -> str:
+    def _call_openai_model(self, messages: list, model_id: str, stream: bool = False):
         """Call OpenAI model (GPT-4o) with enhanced parameters"""
         if not self.openai_client:
             raise ValueError("OpenAI client not initialized")
@@ -56,11 +77,20 @@ class StrategyEngine:
             temperature=0.7,
             top_p=0.9,
             frequency_penalty=0.1,
-            presence_penalty=0.1
+            presence_penalty=0.1,
+            stream=stream
         )
         
+        if stream:
+            return response
         return response.choices[0].message.content
     
+    def _stream_openai_model(self, messages: list, model_id: str) -> Iterator[str]:
+        """Stream text chunks from an OpenAI model as they are generated"""
+        for chunk in self._call_openai_model(messages, model_id, stream=True):
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    
     @staticmethod
     def _normalize_profile(profile: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -141,6 +171,29 @@ class StrategyEngine:
         Returns:
             Optimization strategy as markdown string
         """
+        formatted_prompt, model_id = self._build_strategy_prompt(
+            profile_data, target_industry, target_role, model_choice, additional_context
+        )
+        
+        # Call appropriate model
+        if model_choice == "gpt4o":
+            response = self._call_openai_model(formatted_prompt, model_id)
+        elif model_choice == "llama3_custom":
+            response = self._call_together_model(formatted_prompt, model_id)
+        else:
+            raise ValueError(f"Unknown model choice: {model_choice}")
+        
+        return response
+    
+    def _build_strategy_prompt(
+        self,
+        profile_data: Dict[str, Any],
+        target_industry: str,
+        target_role: str,
+        model_choice: str,
+        additional_context: Optional[str] = None
+    ):
+        """Build the model-specific strategy prompt and resolve the model ID"""
         # Get system prompt
         system_prompt = get_system_prompt(target_industry, target_role)
         
@@ -158,15 +211,25 @@ class StrategyEngine:
         # Get model ID
         model_id = PromptFormatter.get_model_id(model_choice)
         
-        # Call appropriate model
-        if model_choice == "gpt4o":
-            response = self._call_openai_model(formatted_prompt, model_id)
-        elif model_choice == "llama3_custom":
-            response = self._call_together_model(formatted_prompt, model_id)
-        else:
-            raise ValueError(f"Unknown model choice: {model_choice}")
-        
-        return response
+        return formatted_prompt, model_id
+    
+    @staticmethod
+    def _profile_to_dict(profile: LinkedInProfile) -> Dict[str, Any]:
+        """Convert a LinkedInProfile into the dict shape used by the prompt builders"""
+        return {
+            "headline": profile.headline,
+            "about": profile.about,
+            "experience": [
+                {
+                    "title": exp.title,
+                    "company": exp.company,
+                    "dates": exp.dates,
+                    "description": exp.description
+                }
+                for exp in profile.experience
+            ],
+            "skills": profile.skills
+        }
     
     def generate_optimization_plan(
         self,
@@ -190,20 +253,7 @@ class StrategyEngine:
             Complete optimization plan as markdown
         """
         # Convert profile to dict
-        profile_data = {
-            "headline": profile.headline,
-            "about": profile.about,
-            "experience": [
-                {
-                    "title": exp.title,
-                    "company": exp.company,
-                    "dates": exp.dates,
-                    "description": exp.description
-                }
-                for exp in profile.experience
-            ],
-            "skills": profile.skills
-        }
+        profile_data = self._profile_to_dict(profile)
         
         # Generate strategy
         strategy = self._generate_strategy(
@@ -212,6 +262,38 @@ class StrategyEngine:
         
         return strategy
     
+    def generate_optimization_plan_stream(
+        self,
+        profile: LinkedInProfile,
+        target_industry: str,
+        target_role: str,
+        model_choice: str = "gpt4o",
+        additional_context: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Stream an optimization plan as text chunks while it is generated.
+        
+        Args:
+            profile: LinkedInProfile object from vision engine
+            target_industry: Target industry
+            target_role: Target role
+            model_choice: Model to use for generation
+            additional_context: Optional additional context
+            
+        Yields:
+            Markdown text chunks; Together AI models yield the full plan at once
+        """
+        formatted_prompt, model_id = self._build_strategy_prompt(
+            self._profile_to_dict(profile), target_industry, target_role, model_choice, additional_context
+        )
+        
+        if model_choice == "gpt4o":
+            yield from self._stream_openai_model(formatted_prompt, model_id)
+        elif model_choice == "llama3_custom":
+            yield self._call_together_model(formatted_prompt, model_id)
+        else:
+            raise ValueError(f"Unknown model choice: {model_choice}")
+    
     def generate_perfect_profile_optimization(
         self,
         current_profile: Dict[str, Any],
@@ -440,14 +522,10 @@ class StrategyEngine:
         Returns:
             Estimated token count
         """
-        # Rough estimation: 1 token ≈ 4 characters
         user_content = format_profile_for_prompt(profile_data, target_industry, target_role)
         system_prompt = get_system_prompt(target_industry, target_role)
         
-        total_text = user_content + system_prompt
-        estimated_tokens = len(total_text) // 4
-        
-        return estimated_tokens
+        return count_tokens(user_content + system_prompt)
     
     def validate_and_enhance_output(self, content: str, target_industry: str, target_role: str) -> Dict[str, Any]:
         """
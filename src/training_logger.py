@@ -3,18 +3,40 @@ Training data logger for fine-tuning dataset collection
 Cloud-optimized for Streamlit Community Cloud deployment
 """
 
+import atexit
 import json
 import os
+import queue
 import tempfile
+import threading
+import time
 from typing import Dict, Any, Optional
 from datetime import datetime
 
 from .config import Config
 
+# Optional orjson for faster serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps_line(record: Dict[str, Any]) -> str:
+    """Serialize a record as a single JSONL line"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(record).decode('utf-8') + '\n'
+    return json.dumps(record, ensure_ascii=False) + '\n'
+
 
 class TrainingLogger:
     """Logger for collecting training examples for fine-tuning"""
     
+    # Background writer settings for queued examples
+    BATCH_SIZE = 20
+    FLUSH_INTERVAL = 5.0
+    
     def __init__(self, dataset_path: Optional[str] = None):
         """
         Initialize training logger.
@@ -23,6 +45,10 @@ class TrainingLogger:
             dataset_path: Path to the training dataset file (uses Config.TRAINING_DATA_PATH if not provided)
         """
         self.dataset_path = dataset_path or Config.TRAINING_DATA_PATH
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+        self._exit_hook_registered = False
         self._ensure_dataset_file()
     
     def _ensure_dataset_file(self):
@@ -33,14 +59,14 @@ class TrainingLogger:
             
             if not os.path.exists(self.dataset_path):
                 # Create empty dataset file
-                with open(self.dataset_path, 'w') as f:
+                with open(self.dataset_path, 'w', encoding='utf-8') as f:
                     f.write("")  # Start with empty file
         except Exception as e:
             # Fallback to temporary directory if original path fails
             temp_path = os.path.join(tempfile.gettempdir(), "training_dataset.jsonl")
             self.dataset_path = temp_path
             try:
-                with open(self.dataset_path, 'w') as f:
+                with open(self.dataset_path, 'w', encoding='utf-8') as f:
                     f.write("")
             except Exception as fallback_error:
                 print(f"Warning: Could not create training dataset file: {fallback_error}")
@@ -52,7 +78,7 @@ class TrainingLogger:
         
         if os.path.exists(self.dataset_path):
             try:
-                with open(self.dataset_path, 'r') as f:
+                with open(self.dataset_path, 'r', encoding='utf-8') as f:
                     content = f.read().strip()
                     if content:
                         # Read line by line for JSONL format
@@ -95,26 +121,14 @@ class TrainingLogger:
             
         try:
             # Create training example
-            example = {
-                "timestamp": datetime.utcnow().isoformat(),
-                "input": {
-                    "profile_data": input_text,
-                    "target_industry": target_industry,
-                    "target_role": target_role,
-                    "additional_context": additional_context
-                },
-                "output": output_text,
-                "metadata": {
-                    "model_choice": model_choice,
-                    "feedback_score": feedback_score,
-                    "input_length": len(input_text),
-                    "output_length": len(output_text)
-                }
-            }
+            example = self._build_training_example(
+                input_text, target_industry, target_role, output_text,
+                model_choice, feedback_score, additional_context
+            )
             
             # Append to dataset file (JSONL format)
-            with open(self.dataset_path, 'a') as f:
-                f.write(json.dumps(example) + '\n')
+            with open(self.dataset_path, 'a', encoding='utf-8') as f:
+                f.write(_dumps_line(example))
             
             return True
             
@@ -122,6 +136,113 @@ class TrainingLogger:
             print(f"Failed to log training example: {e}")
             return False
     
+    def enqueue_training_example(
+        self,
+        input_text: str,
+        target_industry: str,
+        target_role: str,
+        output_text: str,
+        model_choice: str,
+        feedback_score: Optional[str] = None,
+        additional_context: Optional[str] = None
+    ) -> bool:
+        """
+        Queue a training example for the background writer.
+        
+        Examples are appended to the dataset in batches of up to BATCH_SIZE,
+        or every FLUSH_INTERVAL seconds, so callers never wait on file I/O.
+        
+        Returns:
+            True if the example was queued, False otherwise
+        """
+        if not self.dataset_path:
+            print("Warning: No valid dataset path available for logging")
+            return False
+        
+        self._queue.put(self._build_training_example(
+            input_text, target_industry, target_role, output_text,
+            model_choice, feedback_score, additional_context
+        ))
+        self._ensure_worker()
+        return True
+    
+    def flush(self):
+        """Block until all queued examples have been written"""
+        self._queue.join()
+    
+    @staticmethod
+    def _build_training_example(
+        input_text: str,
+        target_industry: str,
+        target_role: str,
+        output_text: str,
+        model_choice: str,
+        feedback_score: Optional[str],
+        additional_context: Optional[str]
+    ) -> Dict[str, Any]:
+        """Build a training example record"""
+        return {
+            "timestamp": datetime.utcnow().isoformat(),
+            "input": {
+                "profile_data": input_text,
+                "target_industry": target_industry,
+                "target_role": target_role,
+                "additional_context": additional_context
+            },
+            "output": output_text,
+            "metadata": {
+                "model_choice": model_choice,
+                "feedback_score": feedback_score,
+                "input_length": len(input_text),
+                "output_length": len(output_text)
+            }
+        }
+    
+    def _ensure_worker(self):
+        """Start the background writer thread if it is not running"""
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._drain_queue, name="training-logger", daemon=True
+                )
+                self._worker.start()
+                
+                # The writer is a daemon thread, so write out the queue before exit
+                if not self._exit_hook_registered:
+                    atexit.register(self._flush_on_exit)
+                    self._exit_hook_registered = True
+    
+    def _flush_on_exit(self):
+        """Wake the writer so it skips its batching wait, then wait for the queue to drain"""
+        self._queue.put(None)
+        self.flush()
+    
+    def _drain_queue(self):
+        """Write queued examples to the dataset file in batches"""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.FLUSH_INTERVAL
+            try:
+                # A None entry asks for the current batch to be written immediately
+                while len(batch) < self.BATCH_SIZE and batch[-1] is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                pass
+            
+            try:
+                examples = [example for example in batch if example is not None]
+                if examples:
+                    with open(self.dataset_path, 'a', encoding='utf-8') as f:
+                        f.write(''.join(_dumps_line(example) for example in examples))
+            except Exception as e:
+                print(f"Failed to log training examples: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+    
     def log_section_feedback(
         self,
         section_name: str,
@@ -172,8 +293,8 @@ class TrainingLogger:
             }
             
             # Append to dataset file
-            with open(self.dataset_path, 'a') as f:
-                f.write(json.dumps(example) + '\n')
+            with open(self.dataset_path, 'a', encoding='utf-8') as f:
+                f.write(_dumps_line(example))
             
             return True
             
@@ -278,9 +399,9 @@ class TrainingLogger:
                     clean_examples.append(clean_example)
             
             # Write clean dataset
-            with open(output_path, 'w') as f:
+            with open(output_path, 'w', encoding='utf-8') as f:
                 for example in clean_examples:
-                    f.write(json.dumps(example) + '\n')
+                    f.write(_dumps_line(example))
             
             print(f"Exported {len(clean_examples)} examples to {output_path}")
             return True
@@ -301,7 +422,7 @@ class TrainingLogger:
             return False
             
         try:
-            with open(self.dataset_path, 'w') as f:
+            with open(self.dataset_path, 'w', encoding='utf-8') as f:
                 f.write("")
             return True
         except Exception as e:
@@ -325,7 +446,7 @@ class TrainingLogger:
         if info["path_exists"]:
             try:
                 # Test writeability
-                with open(self.dataset_path, 'a') as f:
+                with open(self.dataset_path, 'a', encoding='utf-8') as f:
                     f.write("")
                 info["is_writable"] = True
             except:
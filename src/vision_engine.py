@@ -6,6 +6,7 @@ import json
 import time
 import re
 import base64
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from pydantic import BaseModel, Field
 from openai import OpenAI
@@ -13,6 +14,18 @@ from openai import OpenAI
 from .config import Config
 from .image_utils import process_uploaded_images
 
+_NON_WORD_RE = re.compile(r'\W+')
+
+# Appended to the prompt when each screenshot is extracted on its own
+SINGLE_SCREENSHOT_NOTE = """
+ SINGLE SCREENSHOT MODE:
+- This image is ONE of several screenshots of the same profile
+- Extract ONLY what is visible in this screenshot
+- Return "" for the headline or About section if it is not visible here
+- Return [] for experience or skills if none are visible here
+- If an experience entry is cut off at the top, return only its visible description and leave title, company and dates as ""
+"""
+
 
 class ExperienceItem(BaseModel):
     """Model for a single experience item"""
@@ -111,15 +124,19 @@ You are an expert LinkedIn profile data extractor. Your task is to extract ALL v
 Return ONLY the JSON object - no explanations or extra text.
 """
     
-    def _prepare_messages(self, base64_images: List[str]) -> List[Dict[str, Any]]:
+    def _prepare_messages(self, base64_images: List[str], single_screenshot: bool = False) -> List[Dict[str, Any]]:
         """Prepare messages for the vision API call"""
+        prompt = self._create_vision_prompt()
+        if single_screenshot:
+            prompt += SINGLE_SCREENSHOT_NOTE
+        
         messages = [
             {
                 "role": "user",
                 "content": [
                     {
                         "type": "text",
-                        "text": self._create_vision_prompt()
+                        "text": prompt
                     }
                 ]
             }
@@ -131,7 +148,7 @@ Return ONLY the JSON object - no explanations or extra text.
                 "type": "image_url",
                 "image_url": {
                     "url": f"data:image/jpeg;base64,{base64_image}",
-                    "detail": "high"
+                    "detail": Config.VISION_IMAGE_DETAIL
                 }
             })
         
@@ -308,61 +325,194 @@ Return ONLY the JSON object - no explanations or extra text.
             # Process images
             base64_images = process_uploaded_images(
                 uploaded_files, 
-                max_width=Config.MAX_IMAGE_WIDTH
+                max_width=Config.MAX_IMAGE_WIDTH,
+                max_height=Config.MAX_IMAGE_HEIGHT
             )
             
             if not base64_images:
                 raise ValueError("No valid images could be processed")
             
-            # Prepare API call
-            messages = self._prepare_messages(base64_images)
+            return self._extract_from_images(base64_images)
             
-            # Call vision model with retry logic
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    response = self.client.chat.completions.create(
-                        model=Config.GPT4O_VISION_MODEL_ID,
-                        messages=messages,
-                        max_tokens=3000,  # Increased from 2000 to capture longer experience descriptions
-                        temperature=0.1
-                    )
-                    break
-                except Exception as api_error:
-                    if attempt == max_retries - 1:
-                        raise api_error
-                    time.sleep(2 ** attempt)  # Exponential backoff
+        except Exception as e:
+            raise RuntimeError(self._format_extraction_error(e))
+    
+    def extract_profile_data_parallel(self, uploaded_files, max_concurrency: int = 4) -> LinkedInProfile:
+        """
+        Extract profile data with one concurrent vision request per screenshot.
+        
+        Args:
+            uploaded_files: List of uploaded file objects from Streamlit
+            max_concurrency: Maximum number of in-flight vision requests
             
-            # Extract and parse response
-            response_text = response.choices[0].message.content
-            if not response_text:
-                raise ValueError("Empty response from vision model")
+        Returns:
+            LinkedInProfile object merged from the per-screenshot extractions
+        """
+        if not uploaded_files:
+            raise ValueError("No image files provided")
+        
+        try:
+            base64_images = process_uploaded_images(
+                uploaded_files, 
+                max_width=Config.MAX_IMAGE_WIDTH,
+                max_height=Config.MAX_IMAGE_HEIGHT
+            )
             
-            # Log the raw response for debugging
-            print(f"Raw vision response: {response_text[:200]}...")
+            if not base64_images:
+                raise ValueError("No valid images could be processed")
             
-            profile = self._parse_response(response_text)
-            return profile
+            if len(base64_images) == 1:
+                return self._extract_from_images(base64_images)
+            
+            # The OpenAI client is thread-safe; requests are I/O bound
+            with ThreadPoolExecutor(max_workers=min(max_concurrency, len(base64_images))) as executor:
+                results = list(executor.map(self._extract_single_screenshot, base64_images))
             
+            # One unreadable screenshot should not discard the others
+            profiles = [result for result in results if isinstance(result, LinkedInProfile)]
+            if not profiles:
+                raise results[0]
+            
+            return self._merge_profiles(profiles)
+            
+        except Exception as e:
+            raise RuntimeError(self._format_extraction_error(e))
+    
+    def _extract_single_screenshot(self, base64_image: str):
+        """Extract one screenshot, returning the exception instead of raising it"""
+        try:
+            return self._extract_from_images([base64_image], single_screenshot=True)
         except Exception as e:
-            # Add more context to the error
-            error_str = str(e).lower()
-            error_msg = f"Vision extraction failed: {str(e)}"
+            print(f"Screenshot extraction failed: {e}")
+            return e
+    
+    def _extract_from_images(self, base64_images: List[str], single_screenshot: bool = False) -> LinkedInProfile:
+        """Run a single vision request over the given images and parse the result"""
+        # Prepare API call
+        messages = self._prepare_messages(base64_images, single_screenshot)
+        
+        # Call vision model with retry logic
+        max_retries = 3
+        for attempt in range(max_retries):
+            try:
+                response = self.client.chat.completions.create(
+                    model=Config.GPT4O_VISION_MODEL_ID,
+                    messages=messages,
+                    max_tokens=3000,  # Increased from 2000 to capture longer experience descriptions
+                    temperature=0.1
+                )
+                break
+            except Exception as api_error:
+                if attempt == max_retries - 1:
+                    raise api_error
+                time.sleep(2 ** attempt)  # Exponential backoff
+        
+        # Extract and parse response
+        response_text = response.choices[0].message.content
+        if not response_text:
+            raise ValueError("Empty response from vision model")
+        
+        # Log the raw response for debugging
+        print(f"Raw vision response: {response_text[:200]}...")
+        
+        return self._parse_response(response_text)
+    
+    @staticmethod
+    def _merge_text(current: str, new: str) -> str:
+        """Combine two extractions of the same text, dropping repeated lines where they overlap"""
+        if not new or new in current:
+            return current
+        if not current or current in new:
+            return new
+        
+        current_lines = current.splitlines()
+        new_lines = new.splitlines()
+        for overlap in range(min(len(current_lines), len(new_lines)), 0, -1):
+            if current_lines[-overlap:] == new_lines[:overlap]:
+                return '\n'.join(current_lines + new_lines[overlap:])
+        
+        return current + '\n' + new
+    
+    @staticmethod
+    def _merge_profiles(profiles: List[LinkedInProfile]) -> LinkedInProfile:
+        """Merge per-screenshot extractions in upload order, ignoring sections a screenshot left empty"""
+        merge_text = VisionEngine._merge_text
+        normalize = lambda text: _NON_WORD_RE.sub(' ', text).strip().lower()
+        
+        headline = ""
+        about = ""
+        experience = []
+        experience_index = {}
+        skills = []
+        seen_skills = set()
+        
+        for profile in profiles:
+            headline = headline or profile.headline.strip()
+            if profile.about.strip():
+                about = merge_text(about, profile.about.strip())
             
-            if "connection" in error_str or "connect" in error_str:
-                error_msg = "Vision extraction failed: Connection error. Please check your internet connection and OpenAI API key configuration in Streamlit Cloud secrets."
-            elif "JSON" in str(e):
-                error_msg += " - The vision model had trouble parsing the LinkedIn screenshots. Please try with clearer images."
-            elif "rate limit" in error_str:
-                error_msg += " - Rate limit exceeded. Please wait a moment and try again."
-            elif "timeout" in error_str:
-                error_msg += " - Request timed out. Please try with smaller or fewer images."
-            elif "api key" in error_str or "authentication" in error_str or "unauthorized" in error_str:
-                error_msg = "Vision extraction failed: Invalid or missing OpenAI API key. Please check your Streamlit Cloud secrets configuration."
-            elif "quota" in error_str or "insufficient" in error_str:
-                error_msg = "Vision extraction failed: OpenAI API quota exceeded. Please check your OpenAI account billing."
+            previous_last = len(experience) - 1
+            for position, exp in enumerate(profile.experience):
+                title, company = normalize(exp.title), normalize(exp.company)
+                target = experience_index.get((title, company)) if title or company else None
+                
+                # An entry cut off at the bottom of the previous screenshot continues at the top of this one
+                if target is None and position == 0 and previous_last >= 0:
+                    last = experience[previous_last]
+                    if (not title or title == normalize(last['title'])) and (not company or company == normalize(last['company'])):
+                        target = previous_last
+                
+                if target is None:
+                    if not (title or company or exp.description.strip()):
+                        continue
+                    if title or company:
+                        experience_index[(title, company)] = len(experience)
+                    experience.append({
+                        'title': exp.title,
+                        'company': exp.company,
+                        'dates': exp.dates,
+                        'description': exp.description.strip()
+                    })
+                else:
+                    entry = experience[target]
+                    entry['title'] = entry['title'] or exp.title
+                    entry['company'] = entry['company'] or exp.company
+                    entry['dates'] = entry['dates'] or exp.dates
+                    entry['description'] = merge_text(entry['description'], exp.description.strip())
             
-            raise RuntimeError(error_msg)
+            for skill in profile.skills:
+                if skill.strip() and skill.lower() not in seen_skills:
+                    seen_skills.add(skill.lower())
+                    skills.append(skill)
+        
+        return LinkedInProfile(
+            headline=headline,
+            about=about,
+            experience=[ExperienceItem(**entry) for entry in experience],
+            skills=skills
+        )
+    
+    @staticmethod
+    def _format_extraction_error(e: Exception) -> str:
+        """Build a user-facing message for a failed extraction"""
+        # Add more context to the error
+        error_str = str(e).lower()
+        error_msg = f"Vision extraction failed: {str(e)}"
+        
+        if "connection" in error_str or "connect" in error_str:
+            error_msg = "Vision extraction failed: Connection error. Please check your internet connection and OpenAI API key configuration in Streamlit Cloud secrets."
+        elif "JSON" in str(e):
+            error_msg += " - The vision model had trouble parsing the LinkedIn screenshots. Please try with clearer images."
+        elif "rate limit" in error_str:
+            error_msg += " - Rate limit exceeded. Please wait a moment and try again."
+        elif "timeout" in error_str:
+            error_msg += " - Request timed out. Please try with smaller or fewer images."
+        elif "api key" in error_str or "authentication" in error_str or "unauthorized" in error_str:
+            error_msg = "Vision extraction failed: Invalid or missing OpenAI API key. Please check your Streamlit Cloud secrets configuration."
+        elif "quota" in error_str or "insufficient" in error_str:
+            error_msg = "Vision extraction failed: OpenAI API quota exceeded. Please check your OpenAI account billing."
+        
+        return error_msg
     
     def validate_extraction(self, profile: LinkedInProfile) -> Dict[str, Any]:
         """
@@ -0,0 +1,73 @@
+"""
+Tests for batch profile scoring in the content quality scorer
+"""
+
+import random
+
+import pytest
+
+pytest.importorskip("pandas")
+
+from src.content_scorer import ContentQualityScorer
+
+WORDS = [
+    "helping", "driving", "seeking", "journey", "passion", "connect", "reach out",
+    "software", "data", "ai", "financial", "patient", "brand", "revenue",
+    "led", "managed", "increased", "reduced", "achieved", "resulted in",
+    "%", "$", "million", "growth", "python", "sql", "leadership", "strategy",
+    "software engineer", "team", "the", "and", "built", "Products."
+]
+
+
+def random_text(rng, max_words):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, max_words)))
+
+
+def random_profile(rng):
+    return {
+        "headline": random_text(rng, 20),
+        "about": random_text(rng, 600),
+        "experience": [
+            {"title": random_text(rng, 3), "company": "Acme", "dates": "2020", "description": random_text(rng, 40)}
+            for _ in range(rng.randint(0, 3))
+        ],
+        "skills": [random_text(rng, 2) for _ in range(rng.randint(0, 25))],
+    }
+
+
+def assert_batch_matches_scalar(scorer, profiles, target_industry, target_role):
+    batch = scorer.score_profiles_batch(profiles, target_industry, target_role)
+    
+    assert len(batch) == len(profiles)
+    for row, profile in zip(batch.itertuples(index=False), profiles):
+        expected = scorer.calculate_overall_score(profile, target_industry, target_role)
+        for section in ("headline", "about", "experience", "skills", "overall"):
+            assert getattr(row, f"{section}_score") == expected[section].score, (section, profile)
+
+
+def test_batch_matches_scalar_on_edge_profiles():
+    scorer = ContentQualityScorer()
+    profiles = [
+        {},
+        {"headline": "", "about": "", "experience": [], "skills": []},
+        {
+            "headline": "Software Engineer helping teams ship reliable data platforms at scale for fintech",
+            "about": "My journey and passion for software and data. " * 60 + "Let's connect.",
+            "experience": [{"title": "Engineer", "company": "Acme", "dates": "2020", "description": "Led and increased growth 20%, resulted in $1 million"}],
+            "skills": ["Python", "SQL", "Leadership", "Data Engineering"],
+        },
+        # Lowercasing 'İ' adds a combining dot, so lowercased length differs from the raw length
+        {"headline": "İ" * 55 + " abc", "about": "Über café — naïve résumé 🚀 " * 20},
+    ]
+    
+    for target_industry in ("Technology", "Finance", "Underwater Basket Weaving"):
+        assert_batch_matches_scalar(scorer, profiles, target_industry, "Software Engineer")
+
+
+def test_batch_matches_scalar_on_random_profiles():
+    scorer = ContentQualityScorer()
+    rng = random.Random(7)
+    profiles = [random_profile(rng) for _ in range(150)]
+    
+    for target_industry in ("Technology", "Sales", "Unknown Industry"):
+        assert_batch_matches_scalar(scorer, profiles, target_industry, "Software Engineer")
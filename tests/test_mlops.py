@@ -0,0 +1,44 @@
+"""
+Tests for concurrent fine-tune status polling
+"""
+
+from src.mlops import MLOpsManager
+
+
+def make_manager(check_finetune_status):
+    # Skip __init__, which needs the together library and an API key
+    manager = MLOpsManager.__new__(MLOpsManager)
+    manager._terminal_status = {}
+    manager.check_finetune_status = check_finetune_status
+    return manager
+
+
+def test_check_many_isolates_failed_jobs():
+    def check_finetune_status(job_id):
+        if job_id == "expired":
+            raise RuntimeError("Failed to check job status: Job not found: expired")
+        return ("running", None) if job_id == "a" else ("completed", "model-b")
+    
+    manager = make_manager(check_finetune_status)
+    
+    assert manager.check_many(["a", "expired", "b"]) == {
+        "a": ("running", None),
+        "expired": ("error", None),
+        "b": ("completed", "model-b"),
+    }
+
+
+def test_check_many_skips_cached_and_duplicate_jobs():
+    calls = []
+    
+    def check_finetune_status(job_id):
+        calls.append(job_id)
+        return "running", None
+    
+    manager = make_manager(check_finetune_status)
+    manager._terminal_status["done"] = ("completed", "model-done")
+    
+    results = manager.check_many(["done", "a", "a"])
+    
+    assert results == {"done": ("completed", "model-done"), "a": ("running", None)}
+    assert calls == ["a"]
@@ -0,0 +1,64 @@
+"""
+Tests for report section splitting in the one-click implementation system
+"""
+
+from src.one_click_implementation import OneClickImplementation
+
+
+def split(report):
+    return OneClickImplementation()._split_report(report)
+
+
+def test_sections_in_report_order():
+    report = "HEADLINE OPTIMIZATION\nh\nABOUT SECTION COMPLETE REWRITE\na\nSKILLS STRATEGY\ns\n"
+    
+    assert split(report) == {
+        "HEADLINE OPTIMIZATION": "HEADLINE OPTIMIZATION\nh\n",
+        "ABOUT SECTION COMPLETE REWRITE": "ABOUT SECTION COMPLETE REWRITE\na\n",
+        "SKILLS STRATEGY": "SKILLS STRATEGY\ns\n",
+    }
+
+
+def test_missing_sections_are_omitted():
+    assert split("no headers here") == {}
+    assert split("") == {}
+
+
+def test_repeated_header_uses_first_occurrence():
+    report = "HEADLINE OPTIMIZATION\nfirst\nHEADLINE OPTIMIZATION\nsecond\nSKILLS STRATEGY\ns"
+    
+    sections = split(report)
+    
+    assert sections["HEADLINE OPTIMIZATION"] == "HEADLINE OPTIMIZATION\nfirst\nHEADLINE OPTIMIZATION\nsecond\n"
+    assert sections["SKILLS STRATEGY"] == "SKILLS STRATEGY\ns"
+
+
+def test_out_of_order_headers_only_end_at_later_listed_headers():
+    # SKILLS STRATEGY appears first but is listed after ABOUT, so it runs to the end;
+    # HEADLINE ends at the first later-listed header that follows it (ABOUT), not at SKILLS
+    report = "SKILLS STRATEGY\ns\nHEADLINE OPTIMIZATION\nh\nEXPERIENCE SECTION ENHANCEMENT\ne\nABOUT SECTION COMPLETE REWRITE\na"
+    
+    sections = split(report)
+    
+    assert sections["SKILLS STRATEGY"] == report
+    assert sections["HEADLINE OPTIMIZATION"] == (
+        "HEADLINE OPTIMIZATION\nh\nEXPERIENCE SECTION ENHANCEMENT\ne\n"
+    )
+    assert sections["ABOUT SECTION COMPLETE REWRITE"] == (
+        "ABOUT SECTION COMPLETE REWRITE\na"
+    )
+    assert sections["EXPERIENCE SECTION ENHANCEMENT"] == (
+        "EXPERIENCE SECTION ENHANCEMENT\ne\nABOUT SECTION COMPLETE REWRITE\na"
+    )
+
+
+def test_later_listed_header_before_start_is_skipped():
+    # RECOMMENDATIONS STRATEGY occurs before ABOUT, so ABOUT ends at the next later-listed header after it
+    report = "RECOMMENDATIONS STRATEGY\nr\nABOUT SECTION COMPLETE REWRITE\na\nCONTENT & ENGAGEMENT PLAN\nc"
+    
+    sections = split(report)
+    
+    assert sections["ABOUT SECTION COMPLETE REWRITE"] == "ABOUT SECTION COMPLETE REWRITE\na\n"
+    assert sections["RECOMMENDATIONS STRATEGY"] == (
+        "RECOMMENDATIONS STRATEGY\nr\nABOUT SECTION COMPLETE REWRITE\na\n"
+    )